@@ -555,7 +555,11 @@ def test_connections() -> None:
 
         console.print(table)
 
-    asyncio.run(_test())
+    from jfc.clients.base import BaseClient
+
+    # Report unreachable services immediately instead of retrying with backoff
+    with BaseClient.no_retries():
+        asyncio.run(_test())
 
 
 @app.command()
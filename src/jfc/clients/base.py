@@ -1,14 +1,38 @@
 """Base client with common HTTP functionality."""
 
+import asyncio
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from typing import Any, Optional
 
 import httpx
 from loguru import logger
 
+# Responses worth retrying: rate limits and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Methods safe to resend after a server error or dropped connection
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Set by BaseClient.no_retries() so connection checks fail fast
+_retries_disabled: ContextVar[bool] = ContextVar("retries_disabled", default=False)
+
 
 class BaseClient:
     """Base HTTP client with common functionality."""
 
+    # Retry policy (exponential backoff with jitter, honoring Retry-After)
+    MAX_RETRIES = 5
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    # Upper bound on the total time spent waiting between retries of one request
+    RETRY_MAX_TOTAL_DELAY = 60.0
+
+    # Maximum in-flight requests per client (None for unlimited)
+    MAX_CONCURRENT_REQUESTS: Optional[int] = None
+
     def __init__(
         self,
         base_url: str,
@@ -30,6 +54,11 @@ class BaseClient:
         self.timeout = timeout
         self._headers = headers or {}
         self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+            if self.MAX_CONCURRENT_REQUESTS
+            else None
+        )
 
     @property
     def headers(self) -> dict[str, str]:
@@ -61,41 +90,121 @@ class BaseClient:
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
+        retries: Optional[int] = None,
         **kwargs,
     ) -> httpx.Response:
         """
         Make HTTP request.
 
+        Rate-limited (429) responses are retried for any method. Server errors
+        and transport failures are only retried for idempotent methods. Retries
+        stop once RETRY_MAX_TOTAL_DELAY seconds would be spent waiting.
+
         Args:
             method: HTTP method
             endpoint: API endpoint
             params: Query parameters
             json: JSON body
+            retries: Maximum retries (defaults to MAX_RETRIES, 0 to fail fast)
             **kwargs: Additional httpx arguments
 
         Returns:
             HTTP response
         """
         client = await self._get_client()
+        name = self.__class__.__name__
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if _retries_disabled.get():
+            max_retries = 0
+        else:
+            max_retries = self.MAX_RETRIES if retries is None else retries
+        deadline = time.monotonic() + self.RETRY_MAX_TOTAL_DELAY
 
-        logger.debug(f"[{self.__class__.__name__}] {method} {endpoint}")
+        attempt = 0
+        while True:
+            logger.debug(f"[{name}] {method} {endpoint}")
 
-        response = await client.request(
-            method=method,
-            url=endpoint,
-            params=params,
-            json=json,
-            **kwargs,
-        )
+            try:
+                async with self._semaphore or nullcontext():
+                    response = await client.request(
+                        method=method,
+                        url=endpoint,
+                        params=params,
+                        json=json,
+                        **kwargs,
+                    )
+            except httpx.TransportError as e:
+                if not idempotent or attempt >= max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                if time.monotonic() + delay > deadline:
+                    raise
+                logger.warning(
+                    f"[{name}] {method} {endpoint} failed ({e!r}), "
+                    f"retrying in {delay:.1f}s ({attempt + 1}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            status = response.status_code
+            retryable = status in RETRY_STATUS_CODES and (status == 429 or idempotent)
+            if not retryable or attempt >= max_retries:
+                break
+
+            delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+            if time.monotonic() + delay > deadline:
+                break
+            logger.warning(
+                f"[{name}] {method} {endpoint} returned {status}, "
+                f"retrying in {delay:.1f}s ({attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
         if response.status_code >= 400:
             logger.error(
-                f"[{self.__class__.__name__}] {method} {endpoint} "
+                f"[{name}] {method} {endpoint} "
                 f"failed with {response.status_code}: {response.text}"
             )
 
         return response
 
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute the wait before the next retry.
+
+        Args:
+            attempt: Zero-based retry attempt
+            retry_after: Retry-After header value, if the server sent one
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after:
+            try:
+                return float(min(max(float(retry_after), 0.0), self.RETRY_MAX_DELAY))
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+
+        delay = self.RETRY_BASE_DELAY * (2**attempt)
+        return float(min(delay + random.uniform(0, self.RETRY_BASE_DELAY), self.RETRY_MAX_DELAY))
+
+    @staticmethod
+    @contextmanager
+    def no_retries() -> Iterator[None]:
+        """
+        Disable retries for every client request made inside the block.
+
+        Used by connection checks so an unreachable service fails fast
+        instead of backing off.
+        """
+        token = _retries_disabled.set(True)
+        try:
+            yield
+        finally:
+            _retries_disabled.reset(token)
+
     async def get(
         self,
         endpoint: str,
@@ -1,5 +1,6 @@
 """Jellyfin API client for managing collections and media."""
 
+import asyncio
 import base64
 import mimetypes
 import re
@@ -34,6 +35,8 @@ class JellyfinClient(BaseClient):
     """Client for Jellyfin API."""
 
     COLLECTION_ITEMS_BATCH_SIZE = 50
+    # Bound in-flight requests so concurrent batches don't flood the server
+    MAX_CONCURRENT_REQUESTS = 8
 
     def __init__(self, url: str, api_key: str):
         """
@@ -78,10 +81,13 @@ class JellyfinClient(BaseClient):
         Returns:
             List of library items
         """
+        # Only request what LibraryItem keeps; this listing can span the whole library
         base_params = {
             "ParentId": library_id,
             "Recursive": True,
-            "Fields": "ProviderIds,Path,Overview,Genres",
+            "Fields": "ProviderIds,Path,Genres",
+            "EnableImages": False,
+            "EnableUserData": False,
         }
 
         if media_type == MediaType.MOVIE:
@@ -89,54 +95,46 @@ class JellyfinClient(BaseClient):
         elif media_type == MediaType.SERIES:
             base_params["IncludeItemTypes"] = "Series"
 
-        # Jellyfin commonly caps page size (often 500), regardless of higher requested limits.
-        # Fetch in pages until exhausted (or until explicit limit is reached).
-        page_size = 500
-        offset = start_index
-        items: list[LibraryItem] = []
-
-        while len(items) < limit:
-            remaining = limit - len(items)
-            if remaining <= 0:
-                break
-            current_page_size = min(page_size, remaining)
-
-            params = {
-                **base_params,
-                "Limit": current_page_size,
-                "StartIndex": offset,
-            }
-            response = await self.get("/Items", params=params)
+        async def fetch_page(offset: int, size: int) -> dict[str, Any]:
+            response = await self.get(
+                "/Items", params={**base_params, "Limit": size, "StartIndex": offset}
+            )
             response.raise_for_status()
+            page: dict[str, Any] = response.json()
+            return page
 
-            page = response.json().get("Items", [])
-            if not page:
-                break
-
-            for item in page:
-                provider_ids = item.get("ProviderIds", {})
-                items.append(
-                    LibraryItem(
-                        jellyfin_id=item["Id"],
-                        title=item["Name"],
-                        year=item.get("ProductionYear"),
-                        media_type=self._map_item_type(item.get("Type", "")),
-                        tmdb_id=_safe_int(provider_ids.get("Tmdb")),
-                        imdb_id=provider_ids.get("Imdb"),
-                        tvdb_id=_safe_int(provider_ids.get("Tvdb")),
-                        library_id=library_id,
-                        library_name="",
-                        path=item.get("Path"),
-                        genres=item.get("Genres", []) or [],
-                    )
-                )
-
-            fetched = len(page)
-            offset += fetched
-            if fetched < current_page_size:
-                break
-
-        return items
+        # Jellyfin commonly caps page size (often 500), regardless of higher requested limits.
+        # The first page reports the total, so the remaining pages are fetched concurrently
+        # (bounded by MAX_CONCURRENT_REQUESTS).
+        page_size = 500
+        first = await fetch_page(start_index, min(page_size, limit))
+        pages: list[list[dict[str, Any]]] = [first.get("Items", [])]
+        fetched = len(pages[0])
+        total = first.get("TotalRecordCount")
+
+        if fetched and isinstance(total, int):
+            # Page by what the server actually returned, in case it capped the page size
+            end = start_index + min(limit, total - start_index)
+            offsets = range(start_index + fetched, end, fetched)
+            rest = await asyncio.gather(
+                *(fetch_page(offset, min(fetched, end - offset)) for offset in offsets)
+            )
+            pages.extend(page.get("Items", []) for page in rest)
+        else:
+            # No total reported: fetch pages in order until exhausted (or limit reached)
+            offset = start_index + fetched
+            current_page_size = min(page_size, limit)
+            while fetched == current_page_size and offset - start_index < limit:
+                current_page_size = min(page_size, limit - (offset - start_index))
+                page = (await fetch_page(offset, current_page_size)).get("Items", [])
+                pages.append(page)
+                fetched = len(page)
+                offset += fetched
+
+        items = [
+            self._to_library_item(item, library_id) for page in pages for item in page
+        ]
+        return items[:limit]
 
     async def search_items(
         self,
@@ -365,6 +363,7 @@ class JellyfinClient(BaseClient):
         if not item_ids:
             return True
 
+        # Batches are sent sequentially: Jellyfin displays items in insertion order
         success = True
         for i in range(0, len(item_ids), self.COLLECTION_ITEMS_BATCH_SIZE):
             batch = item_ids[i : i + self.COLLECTION_ITEMS_BATCH_SIZE]
@@ -393,6 +392,8 @@ class JellyfinClient(BaseClient):
         """
         Remove items from a collection.
 
+        Items are removed in batches, which are sent concurrently.
+
         Args:
             collection_id: Collection ID
             item_ids: Item IDs to remove
@@ -403,21 +404,26 @@ class JellyfinClient(BaseClient):
         if not item_ids:
             return True
 
-        success = True
-        for i in range(0, len(item_ids), self.COLLECTION_ITEMS_BATCH_SIZE):
-            batch = item_ids[i : i + self.COLLECTION_ITEMS_BATCH_SIZE]
-            response = await self.delete(
-                f"/Collections/{collection_id}/Items",
-                params={"Ids": ",".join(batch)},
+        # Removal order doesn't matter, so batches are sent concurrently
+        batch_size = self.COLLECTION_ITEMS_BATCH_SIZE
+        responses = await asyncio.gather(
+            *(
+                self.delete(
+                    f"/Collections/{collection_id}/Items",
+                    params={"Ids": ",".join(item_ids[i : i + batch_size])},
+                )
+                for i in range(0, len(item_ids), batch_size)
             )
+        )
 
+        success = True
+        for batch_number, response in enumerate(responses, start=1):
             if response.status_code != 204:
                 logger.error(
                     f"Failed to remove items from collection: {response.status_code} "
-                    f"(batch {i // self.COLLECTION_ITEMS_BATCH_SIZE + 1})"
+                    f"(batch {batch_number})"
                 )
                 success = False
-                break
 
         if success:
             logger.debug(f"Removed {len(item_ids)} items from collection {collection_id}")
@@ -571,6 +577,28 @@ class JellyfinClient(BaseClient):
     # Helpers
     # =========================================================================
 
+    def _to_library_item(self, item: dict[str, Any], library_id: str) -> LibraryItem:
+        """
+        Convert a Jellyfin /Items entry to a LibraryItem.
+
+        Library listings can hold tens of thousands of entries whose fields are
+        already typed by Jellyfin (and normalized here), so validation is skipped.
+        """
+        provider_ids = item.get("ProviderIds") or {}
+        return LibraryItem.model_construct(
+            jellyfin_id=item["Id"],
+            title=item["Name"],
+            year=item.get("ProductionYear"),
+            media_type=self._map_item_type(item.get("Type", "")),
+            tmdb_id=_safe_int(provider_ids.get("Tmdb")),
+            imdb_id=provider_ids.get("Imdb"),
+            tvdb_id=_safe_int(provider_ids.get("Tvdb")),
+            library_id=library_id,
+            library_name="",
+            path=item.get("Path"),
+            genres=item.get("Genres", []) or [],
+        )
+
     def _map_item_type(self, jellyfin_type: str) -> MediaType:
         """Map Jellyfin item type to MediaType."""
         mapping = {
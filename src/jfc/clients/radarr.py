@@ -150,7 +150,7 @@ class RadarrClient(BaseClient):
             return self._blocklist_tmdb_ids
 
         blocklist = await self.get_blocklist()
-        self._blocklist_tmdb_ids = set()
+        ids: set[int] = set()
 
         for entry in blocklist:
             # Get movie details to find TMDb ID
@@ -163,12 +163,14 @@ class RadarrClient(BaseClient):
                         movie = response.json()
                         tmdb_id = movie.get("tmdbId")
                         if tmdb_id:
-                            self._blocklist_tmdb_ids.add(tmdb_id)
+                            ids.add(tmdb_id)
                 except Exception:
                     pass
 
-        logger.debug(f"Loaded {len(self._blocklist_tmdb_ids)} blocked movies from Radarr")
-        return self._blocklist_tmdb_ids
+        logger.debug(f"Loaded {len(ids)} blocked movies from Radarr")
+        # Publish only once complete, so concurrent callers never see a partial set
+        self._blocklist_tmdb_ids = ids
+        return ids
 
     async def is_blocklisted(self, tmdb_id: int) -> bool:
         """
@@ -209,15 +211,17 @@ class RadarrClient(BaseClient):
             return self._exclusion_tmdb_ids
 
         exclusions = await self.get_exclusions()
-        self._exclusion_tmdb_ids = set()
+        ids: set[int] = set()
 
         for entry in exclusions:
             tmdb_id = entry.get("tmdbId")
             if tmdb_id:
-                self._exclusion_tmdb_ids.add(tmdb_id)
+                ids.add(tmdb_id)
 
-        logger.debug(f"Loaded {len(self._exclusion_tmdb_ids)} excluded movies from Radarr")
-        return self._exclusion_tmdb_ids
+        logger.debug(f"Loaded {len(ids)} excluded movies from Radarr")
+        # Publish only once complete, so concurrent callers never see a partial set
+        self._exclusion_tmdb_ids = ids
+        return ids
 
     async def is_excluded(self, tmdb_id: int) -> bool:
         """
@@ -361,16 +365,20 @@ class RadarrClient(BaseClient):
     # Status
     # =========================================================================
 
-    async def get_status(self) -> dict[str, Any]:
-        """Get Radarr system status."""
-        response = await self.get("/api/v3/system/status")
+    async def get_status(self, retries: Optional[int] = None) -> dict[str, Any]:
+        """Get Radarr system status.
+
+        Args:
+            retries: Maximum retries (defaults to the client policy, 0 to fail fast)
+        """
+        response = await self.get("/api/v3/system/status", retries=retries)
         response.raise_for_status()
         return response.json()
 
     async def health_check(self) -> bool:
         """Check if Radarr is healthy."""
         try:
-            await self.get_status()
+            await self.get_status(retries=0)
             return True
         except Exception:
             return False
@@ -150,7 +150,7 @@ class SonarrClient(BaseClient):
             return self._blocklist_tvdb_ids
 
         blocklist = await self.get_blocklist()
-        self._blocklist_tvdb_ids = set()
+        ids: set[int] = set()
 
         for entry in blocklist:
             # Get series details to find TVDB ID
@@ -163,12 +163,14 @@ class SonarrClient(BaseClient):
                         series = response.json()
                         tvdb_id = series.get("tvdbId")
                         if tvdb_id:
-                            self._blocklist_tvdb_ids.add(tvdb_id)
+                            ids.add(tvdb_id)
                 except Exception:
                     pass
 
-        logger.debug(f"Loaded {len(self._blocklist_tvdb_ids)} blocked series from Sonarr")
-        return self._blocklist_tvdb_ids
+        logger.debug(f"Loaded {len(ids)} blocked series from Sonarr")
+        # Publish only once complete, so concurrent callers never see a partial set
+        self._blocklist_tvdb_ids = ids
+        return ids
 
     async def is_blocklisted(self, tvdb_id: int) -> bool:
         """
@@ -209,15 +211,17 @@ class SonarrClient(BaseClient):
             return self._exclusion_tvdb_ids
 
         exclusions = await self.get_exclusions()
-        self._exclusion_tvdb_ids = set()
+        ids: set[int] = set()
 
         for entry in exclusions:
             tvdb_id = entry.get("tvdbId")
             if tvdb_id:
-                self._exclusion_tvdb_ids.add(tvdb_id)
+                ids.add(tvdb_id)
 
-        logger.debug(f"Loaded {len(self._exclusion_tvdb_ids)} excluded series from Sonarr")
-        return self._exclusion_tvdb_ids
+        logger.debug(f"Loaded {len(ids)} excluded series from Sonarr")
+        # Publish only once complete, so concurrent callers never see a partial set
+        self._exclusion_tvdb_ids = ids
+        return ids
 
     async def is_excluded(self, tvdb_id: int) -> bool:
         """
@@ -373,16 +377,20 @@ class SonarrClient(BaseClient):
     # Status
     # =========================================================================
 
-    async def get_status(self) -> dict[str, Any]:
-        """Get Sonarr system status."""
-        response = await self.get("/api/v3/system/status")
+    async def get_status(self, retries: Optional[int] = None) -> dict[str, Any]:
+        """Get Sonarr system status.
+
+        Args:
+            retries: Maximum retries (defaults to the client policy, 0 to fail fast)
+        """
+        response = await self.get("/api/v3/system/status", retries=retries)
         response.raise_for_status()
         return response.json()
 
     async def health_check(self) -> bool:
         """Check if Sonarr is healthy."""
         try:
-            await self.get_status()
+            await self.get_status(retries=0)
             return True
         except Exception:
             return False
@@ -13,6 +13,7 @@ class TMDbClient(BaseClient):
     """Client for TMDb API v3."""
 
     BASE_URL = "https://api.themoviedb.org/3"
+    MAX_CONCURRENT_REQUESTS = 40
 
     def __init__(self, api_key: str, language: str = "fr", region: str = "FR"):
         """
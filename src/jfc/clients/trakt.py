@@ -12,6 +12,7 @@ class TraktClient(BaseClient):
     """Client for Trakt API v2."""
 
     BASE_URL = "https://api.trakt.tv"
+    MAX_CONCURRENT_REQUESTS = 10
 
     def __init__(
         self,
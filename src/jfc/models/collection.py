@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from jfc.models.media import MediaItem
+
 
 class SyncMode(str, Enum):
     """Collection sync mode."""
@@ -158,6 +160,42 @@ class CollectionItem(BaseModel):
     # TMDb poster path for notifications (e.g., "/abc123.jpg")
     poster_path: Optional[str] = None
 
+    @classmethod
+    def from_media_item(
+        cls,
+        item: MediaItem,
+        *,
+        jellyfin_id: Optional[str] = None,
+        matched: bool = False,
+    ) -> "CollectionItem":
+        """
+        Build a collection item from a provider media item.
+
+        Provider items are already validated, so this skips re-validation.
+
+        Args:
+            item: Source media item
+            jellyfin_id: Jellyfin ID of the matched library item, if any
+            matched: Whether the item was found in the library
+
+        Returns:
+            CollectionItem carrying the item's IDs and poster metadata
+        """
+        return cls.model_construct(
+            title=item.title,
+            year=item.year,
+            tmdb_id=item.tmdb_id,
+            imdb_id=item.imdb_id,
+            tvdb_id=item.tvdb_id,
+            jellyfin_id=jellyfin_id,
+            media_type=item.media_type.value,
+            matched=matched,
+            in_library=matched,
+            overview=item.overview,
+            genres=item.genres or None,
+            poster_path=item.poster_path,
+        )
+
 
 class CollectionConfig(BaseModel):
     """Configuration for a single collection (from Kometa YAML)."""
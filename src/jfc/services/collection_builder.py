@@ -1,11 +1,14 @@
 """Service for building collections from Kometa configurations."""
 
+import asyncio
+import functools
 import random
 import re
 import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
 from datetime import date
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional, TypeVar, overload
 
 from loguru import logger
 
@@ -27,12 +30,223 @@ from jfc.models.collection import (
 from jfc.models.media import LibraryItem, MediaItem, MediaType, Movie, Series
 from jfc.models.report import CollectionReport
 from jfc.services.media_matcher import MediaMatcher
-from jfc.services.poster_generator import PosterGenerator
+from jfc.services.poster_generator import MAX_CONTEXT_ITEMS, PosterGenerator
+
+T = TypeVar("T")
+
+# Maximum number of concurrent provider requests per fan-out
+MAX_CONCURRENT_REQUESTS = 8
+# Radarr/Sonarr run lookups and searches per add, so keep their fan-out small
+MAX_CONCURRENT_ARR_REQUESTS = 4
+
+# List URL patterns, e.g. https://www.themoviedb.org/list/710
+TMDB_LIST_URL_PATTERN = re.compile(r"/list/(\d+)")
+TRAKT_LIST_URL_PATTERN = re.compile(r"trakt\.tv/users/([^/]+)/lists/([^/?#]+)", re.IGNORECASE)
+
+
+@overload
+async def _gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int = ...,
+    return_exceptions: Literal[False] = ...,
+) -> list[T]: ...
+
+
+@overload
+async def _gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int = ...,
+    *,
+    return_exceptions: Literal[True],
+) -> list[T | BaseException]: ...
+
+
+async def _gather_bounded(
+    aws: Iterable[Awaitable[T]],
+    limit: int = MAX_CONCURRENT_REQUESTS,
+    return_exceptions: bool = False,
+) -> list[T] | list[T | BaseException]:
+    """Await coroutines concurrently (at most `limit` at once), preserving order."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(_run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+def _dedupe_key(item: MediaItem) -> Optional[tuple[str, int | str]]:
+    """Get the identity key used to deduplicate provider items (best ID first)."""
+    if item.tmdb_id:
+        return ("tmdb", item.tmdb_id)
+    if item.imdb_id:
+        return ("imdb", item.imdb_id)
+    if item.tvdb_id:
+        return ("tvdb", item.tvdb_id)
+    if item.title:
+        return ("title", f"{item.title.lower()}::{item.year or 0}")
+    return None
+
+
+def _iter_unique(items: Iterable[MediaItem]) -> Iterator[MediaItem]:
+    """Yield items in order, skipping duplicates and items without any identity."""
+    seen_keys: set[tuple[str, int | str]] = set()
+    for item in items:
+        dedupe_key = _dedupe_key(item)
+        if dedupe_key is None or dedupe_key in seen_keys:
+            continue
+        seen_keys.add(dedupe_key)
+        yield item
+
+
+def _sort_key_name(item: CollectionItem) -> str:
+    return (item.sort_name or item.title).lower()
+
+
+@functools.lru_cache(maxsize=256)
+def _start_of_year(year: int) -> date:
+    return date(year, 1, 1)
+
+
+def _sort_key_premiere(item: CollectionItem) -> tuple[date, str]:
+    # Use year as fallback (memoized, since many items share a year)
+    premiere = item.premiere_date or (_start_of_year(item.year) if item.year else date.min)
+    return (premiere, item.title)
+
+
+def _sort_key_rating(item: CollectionItem) -> tuple[float, str]:
+    # Sort descending (highest first) - use negative
+    return (-(item.community_rating or 0), item.title)
+
+
+def _sort_key_critic(item: CollectionItem) -> tuple[float, str]:
+    return (-(item.critic_rating or 0), item.title)
+
+
+def _sort_key_created(item: CollectionItem) -> tuple[date, str]:
+    return (item.date_created or date.min, item.title)
+
+
+_SORT_KEYS: dict[CollectionOrder, Callable[[CollectionItem], Any]] = {
+    CollectionOrder.SORT_NAME: _sort_key_name,
+    CollectionOrder.PREMIERE_DATE: _sort_key_premiere,
+    CollectionOrder.COMMUNITY_RATING: _sort_key_rating,
+    CollectionOrder.CRITIC_RATING: _sort_key_critic,
+    CollectionOrder.DATE_CREATED: _sort_key_created,
+}
+# Orders sorted descending (newest first)
+_SORT_DESCENDING = frozenset({CollectionOrder.PREMIERE_DATE, CollectionOrder.DATE_CREATED})
+
+# CollectionOrder -> Jellyfin DisplayOrder (anything unlisted uses "Default")
+_DISPLAY_ORDERS = {
+    CollectionOrder.CUSTOM: "Default",
+    CollectionOrder.SORT_NAME: "SortName",
+    # Keep app-level newest-first insertion order for release date.
+    # Jellyfin's PremiereDate display order is often oldest-first.
+    CollectionOrder.PREMIERE_DATE: "Default",
+    CollectionOrder.DATE_CREATED: "DateCreated",
+    CollectionOrder.COMMUNITY_RATING: "CommunityRating",
+    CollectionOrder.CRITIC_RATING: "CommunityRating",  # Jellyfin uses same field
+    CollectionOrder.RANDOM: "Default",  # No random in Jellyfin, use default
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _genre_token(genre: str) -> int | str | None:
+    """Normalize a genre ID string or name; genre vocabularies are small, so cache them."""
+    genre = genre.strip()
+    if not genre:
+        return None
+    if genre.isdigit():
+        return int(genre)
+    normalized = " ".join(genre.lower().replace("-", " ").replace("_", " ").split())
+    return normalized or None
+
+
+# TMDb discover config keys -> TMDb client keyword arguments
+_DISCOVER_MOVIE_PARAMS = {
+    "sort_by": "sort_by",
+    "with_genres": "with_genres",
+    "without_genres": "without_genres",
+    "vote_average.gte": "vote_average_gte",
+    "vote_average.lte": "vote_average_lte",
+    "vote_count.gte": "vote_count_gte",
+    "vote_count.lte": "vote_count_lte",
+    "primary_release_date.gte": "primary_release_date_gte",
+    "primary_release_date.lte": "primary_release_date_lte",
+    "with_watch_providers": "with_watch_providers",
+    "watch_region": "watch_region",
+    "with_original_language": "with_original_language",
+    "with_release_type": "with_release_type",
+    "region": "region",
+}
+_DISCOVER_SERIES_PARAMS = {
+    "sort_by": "sort_by",
+    "with_genres": "with_genres",
+    "without_genres": "without_genres",
+    "vote_average.gte": "vote_average_gte",
+    "vote_count.gte": "vote_count_gte",
+    "vote_count.lte": "vote_count_lte",
+    "first_air_date.gte": "first_air_date_gte",
+    "first_air_date.lte": "first_air_date_lte",
+    "with_watch_providers": "with_watch_providers",
+    "watch_region": "watch_region",
+    "with_status": "with_status",
+    "with_original_language": "with_original_language",
+    "with_origin_country": "with_origin_country",
+}
+
+# Collection item media_type -> MediaItem class (anything else is a movie)
+_MEDIA_CLASS_BY_TYPE: dict[Optional[str], type[Movie] | type[Series]] = {"series": Series}
+
+# Library names that get the cartoon poster category
+CARTOON_LIBRARY_PATTERN = re.compile(r"cartoon|animation|anime|enfant|kids", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=128)
+def _poster_category(library_name: str, media_type: MediaType) -> str:
+    """Map library/media type to poster category (cached per library)."""
+    # Check for cartoon/animation library
+    if CARTOON_LIBRARY_PATTERN.search(library_name):
+        return "CARTOONS"
+
+    # Based on media type
+    if media_type == MediaType.SERIES:
+        return "SÉRIES"
+
+    return "FILMS"
 
 
 class CollectionBuilder:
     """Builds and updates collections in Jellyfin from Kometa configurations."""
 
+    # Config attribute -> source label, in report order
+    _SOURCE_PROVIDERS: tuple[tuple[str, str], ...] = (
+        ("tmdb_trending_weekly", "TMDb Trending"),
+        ("tmdb_trending_daily", "TMDb Trending"),
+        ("tmdb_popular", "TMDb Popular"),
+        ("tmdb_discover", "TMDb Discover"),
+        ("tmdb_list", "TMDb List"),
+        ("trakt_trending", "Trakt Trending"),
+        ("trakt_popular", "Trakt Popular"),
+        ("trakt_chart", "Trakt Chart"),
+        ("imdb_chart", "IMDb Chart"),
+        ("imdb_list", "IMDb List"),
+        ("radarr_taglist", "Radarr Taglist"),
+        ("sonarr_taglist", "Sonarr Taglist"),
+        ("plex_search", "Library Search"),
+    )
+
+    # Trakt chart -> (movie method, series method, takes a time period)
+    _TRAKT_CHARTS: dict[str, tuple[str, str, bool]] = {
+        "watched": ("get_watched_movies", "get_watched_series", True),
+        "trending": ("get_trending_movies", "get_trending_series", False),
+        "popular": ("get_popular_movies", "get_popular_series", False),
+    }
+
     def __init__(
         self,
         jellyfin: JellyfinClient,
@@ -66,8 +280,36 @@ class CollectionBuilder:
         self.poster_generator = poster_generator
         self.dry_run = dry_run
 
-        settings = get_settings()
-        self.matcher = MediaMatcher(jellyfin, preload_limit=settings.matcher_preload_limit)
+        self.settings = get_settings()
+        self.posters_path = self.settings.get_posters_path()
+        self.matcher = MediaMatcher(jellyfin, preload_limit=self.settings.matcher_preload_limit)
+
+        # Jellyfin collections indexed by name (loaded once per run)
+        self._collections_by_name: Optional[dict[str, list[dict[str, Any]]]] = None
+        # Jellyfin collection ID -> item IDs, kept in step with this run's changes
+        self._collection_items: dict[str, list[str]] = {}
+        # Radarr/Sonarr tag maps and catalogs, shared by taglist collections within a run
+        self._radarr_tags: Optional[dict[int, str]] = None
+        self._sonarr_tags: Optional[dict[int, str]] = None
+        self._radarr_movies: Optional[list[dict[str, Any]]] = None
+        self._sonarr_series: Optional[list[dict[str, Any]]] = None
+        # TMDb series ID -> TVDB ID, kept across runs (the mapping is stable)
+        self._tvdb_by_tmdb: dict[int, int] = {}
+
+    def reset(self) -> None:
+        """
+        Reset per-run caches.
+
+        This should be called at the start of each scheduled run so that
+        changes made in Jellyfin between runs are detected.
+        """
+        self._collections_by_name = None
+        self._collection_items = {}
+        self._radarr_tags = None
+        self._sonarr_tags = None
+        self._radarr_movies = None
+        self._sonarr_series = None
+        self.matcher.reset()
 
     async def build_collection(
         self,
@@ -99,56 +341,49 @@ class CollectionBuilder:
             source_provider=self._get_source_provider(config),
         )
 
-        # Fetch items from providers
-        items = await self._fetch_items(config, library_id, media_type)
+        # Fetch items from providers while the library index loads for matching
+        items, _ = await asyncio.gather(
+            self._fetch_items(config, library_id, media_type),
+            self.matcher.prime(library_id, media_type),
+        )
         report.items_fetched = len(items)
-        report.fetched_titles = [item.title for item in items]
-
-        # Store original source items (before filtering) for poster generation
-        # This ensures the poster reflects the true trending/source order
-        source_items = [
-            CollectionItem(
-                title=item.title,
-                year=item.year,
-                tmdb_id=item.tmdb_id,
-                imdb_id=item.imdb_id,
-                tvdb_id=item.tvdb_id,
-                media_type=item.media_type.value,
-                overview=item.overview,
-                genres=item.genres if item.genres else None,
-                poster_path=item.poster_path,
-            )
-            for item in items
-        ]
 
         # Apply filters
         filtered_items = self._apply_filters(items, config)
         report.items_after_filter = len(filtered_items)
 
         # Match items to library
-        collection_items = []
-        for item in filtered_items:
-            lib_item = await self.matcher.find_in_library(item, library_id)
-
-            collection_item = CollectionItem(
-                title=item.title,
-                year=item.year,
-                tmdb_id=item.tmdb_id,
-                imdb_id=item.imdb_id,
-                tvdb_id=item.tvdb_id,
-                jellyfin_id=lib_item.jellyfin_id if lib_item else None,
-                media_type=item.media_type.value,  # "movie" or "series"
-                matched=lib_item is not None,
-                in_library=lib_item is not None,
-                # Preserve metadata for AI poster generation
-                overview=item.overview,
-                genres=item.genres if item.genres else None,
-                poster_path=item.poster_path,
+        matches = iter(await self.matcher.find_many(filtered_items, library_id))
+
+        # Build source items (before filtering, for poster generation), the
+        # fetched titles and collection items in a single pass. Filtered items
+        # are an ordered subsequence of items, so kept items are consumed in lockstep.
+        source_items: list[CollectionItem] = []
+        collection_items: list[CollectionItem] = []
+        kept_items = iter(filtered_items)
+        next_kept = next(kept_items, None)
+        for item in items:
+            source_item = CollectionItem.from_media_item(item)
+            source_items.append(source_item)
+            report.fetched_titles.append(item.title)
+            if item is not next_kept:
+                continue
+            next_kept = next(kept_items, None)
+
+            lib_item = next(matches)
+            found = lib_item is not None
+            collection_items.append(
+                source_item.model_copy(
+                    update={
+                        "jellyfin_id": lib_item.jellyfin_id if lib_item else None,
+                        "matched": found,
+                        "in_library": found,
+                    }
+                )
             )
-            collection_items.append(collection_item)
 
             # Track matched/missing titles
-            if lib_item:
+            if found:
                 report.matched_titles.append(item.title)
             else:
                 report.missing_titles.append(item.title)
@@ -176,32 +411,16 @@ class CollectionBuilder:
 
     def _get_source_provider(self, config: CollectionConfig) -> str:
         """Determine the primary source provider from config."""
-        sources = []
-        if config.tmdb_trending_weekly or config.tmdb_trending_daily:
-            sources.append("TMDb Trending")
-        if config.tmdb_popular:
-            sources.append("TMDb Popular")
-        if config.tmdb_discover:
-            sources.append("TMDb Discover")
-        if config.tmdb_list:
-            sources.append("TMDb List")
-        if config.trakt_trending:
-            sources.append("Trakt Trending")
-        if config.trakt_popular:
-            sources.append("Trakt Popular")
-        if config.trakt_chart:
-            chart = config.trakt_chart.get("chart", "unknown")
-            sources.append(f"Trakt {chart.capitalize()}")
-        if config.imdb_chart:
-            sources.append("IMDb Chart")
-        if config.imdb_list:
-            sources.append("IMDb List")
-        if config.radarr_taglist:
-            sources.append("Radarr Taglist")
-        if config.sonarr_taglist:
-            sources.append("Sonarr Taglist")
-        if config.plex_search:
-            sources.append("Library Search")
+        labels: list[str] = []
+        for attr, label in self._SOURCE_PROVIDERS:
+            if not getattr(config, attr):
+                continue
+            if attr == "trakt_chart" and config.trakt_chart:
+                chart = config.trakt_chart.get("chart", "unknown")
+                label = f"Trakt {chart.capitalize()}"
+            labels.append(label)
+        # Several flags share a label (e.g. daily/weekly trending); keep first occurrence
+        sources = list(dict.fromkeys(labels))
         return ", ".join(sources) if sources else "Unknown"
 
     async def sync_collection(
@@ -232,19 +451,24 @@ class CollectionBuilder:
             return (0, 0, None)
 
         # Get or create Jellyfin collection
-        jellyfin_collections = await self.jellyfin.get_collections()
-        existing_matches = [
-            c for c in jellyfin_collections if c.get("Name") == collection.config.name
-        ]
+        collections_by_name = await self._get_collections_by_name()
+        existing_matches = collections_by_name.get(collection.config.name, [])
         existing = None
         if existing_matches:
-            existing = max(existing_matches, key=lambda c: c.get("ChildCount", 0))
-            if len(existing_matches) > 1:
-                ids = ", ".join(c.get("Id", "unknown") for c in existing_matches)
+            # Single scan: pick the largest duplicate and collect IDs for the warning
+            existing = existing_matches[0]
+            best_count = existing.get("ChildCount", 0)
+            ids = [existing.get("Id", "unknown")]
+            for candidate in existing_matches[1:]:
+                child_count = candidate.get("ChildCount", 0)
+                ids.append(candidate.get("Id", "unknown"))
+                if child_count > best_count:
+                    existing, best_count = candidate, child_count
+            if len(ids) > 1:
                 logger.warning(
-                    f"Found {len(existing_matches)} collections named "
+                    f"Found {len(ids)} collections named "
                     f"'{collection.config.name}'. Using ID {existing.get('Id')} "
-                    f"(largest ChildCount). IDs: {ids}"
+                    f"(largest ChildCount). IDs: {', '.join(ids)}"
                 )
 
         report.collection_existed = existing is not None
@@ -255,45 +479,56 @@ class CollectionBuilder:
             collection.jellyfin_id = await self.jellyfin.create_collection(
                 collection.config.name
             )
+            collections_by_name.setdefault(collection.config.name, []).append(
+                {"Id": collection.jellyfin_id, "Name": collection.config.name, "ChildCount": 0}
+            )
 
-        to_add: set[str] = set()
-        to_remove: set[str] = set()
         to_add_list: list[str] = []
         to_remove_list: list[str] = []
 
         # Skip item sync if posters_only mode
         if not posters_only:
             # Get current items in collection
-            current_ids = set(await self.jellyfin.get_collection_items(collection.jellyfin_id))
-
-            # Sort items according to collection_order
-            sorted_items = self._sort_items_for_collection(
-                collection.items,
-                collection.config.collection_order,
-            )
+            if existing:
+                current_ids_list = await self._get_collection_items(collection.jellyfin_id)
+            else:
+                current_ids_list = []
+            current_ids = set(current_ids_list)
+
+            # Sort items according to collection_order. Random order shuffles
+            # the target ID list built below in place rather than copying items.
+            order = collection.config.collection_order
+            if order == CollectionOrder.RANDOM:
+                sorted_items = collection.items
+            else:
+                sorted_items = self._sort_items_for_collection(collection.items, order)
 
             # Get target items in sorted order (only matched ones)
-            target_ids_list = [
-                item.jellyfin_id for item in sorted_items if item.jellyfin_id
-            ]
-            target_ids = set(target_ids_list)
+            target_ids_list: list[str] = []
+            target_ids: set[str] = set()
+            for item in sorted_items:
+                jellyfin_id = item.jellyfin_id
+                if jellyfin_id:
+                    target_ids_list.append(jellyfin_id)
+                    target_ids.add(jellyfin_id)
+            if order == CollectionOrder.RANDOM:
+                random.shuffle(target_ids_list)
 
             # Calculate changes based on sync mode
             # Preserve source order for additions (important for ranked lists like IMDb Top 250)
             to_add_list = [item_id for item_id in target_ids_list if item_id not in current_ids]
-            to_add = set(to_add_list)
+            # Removals keep the current collection order
             if collection.config.sync_mode == SyncMode.SYNC:
-                to_remove = current_ids - target_ids
-                to_remove_list = list(to_remove)
-            else:
-                to_remove = set()
-                to_remove_list = []
-
-            # Track added/removed titles for report
-            added_jellyfin_ids = to_add
-            for item in collection.items:
-                if item.jellyfin_id in added_jellyfin_ids:
-                    report.added_titles.append(item.title)
+                to_remove_list = [
+                    item_id for item_id in current_ids_list if item_id not in target_ids
+                ]
+
+            # Track added titles for report (nothing to look up without additions)
+            if to_add_list:
+                id_to_title = {i.jellyfin_id: i.title for i in collection.items if i.jellyfin_id}
+                report.added_titles.extend(
+                    id_to_title[jid] for jid in to_add_list if jid in id_to_title
+                )
 
             # Determine if we need to reorder (clear and re-add all)
             # Jellyfin displays items in the order they were added
@@ -306,14 +541,24 @@ class CollectionBuilder:
                         and existing is not None
                     )
                 )
-                and (to_add or to_remove or not existing)
+                and (to_add_list or to_remove_list or not existing)
             )
+            if needs_reorder and existing:
+                # Skip the clear and re-add when plain removals and appends already
+                # leave the collection in target order (e.g. new items sort last)
+                kept_ids = (
+                    [item_id for item_id in current_ids_list if item_id in target_ids]
+                    if to_remove_list
+                    else current_ids_list
+                )
+                if kept_ids + to_add_list == target_ids_list:
+                    needs_reorder = False
 
             if needs_reorder and target_ids_list:
                 # Clear all items and re-add in sorted order
                 if current_ids:
                     removed_ok = await self.jellyfin.remove_from_collection(
-                        collection.jellyfin_id, list(current_ids)
+                        collection.jellyfin_id, current_ids_list
                     )
                     if not removed_ok:
                         raise RuntimeError(
@@ -330,194 +575,238 @@ class CollectionBuilder:
                     f"Reordered '{collection.config.name}' ({len(target_ids_list)} items, "
                     f"order={collection.config.collection_order.value})"
                 )
+                self._collection_items[collection.jellyfin_id] = list(target_ids_list)
             else:
-                # Simple add/remove (no reordering needed)
+                # Simple add/remove (no reordering needed); the two calls are
+                # independent so they run concurrently
+                operations: dict[str, Awaitable[bool]] = {}
                 if to_add_list:
-                    added_ok = await self.jellyfin.add_to_collection(
+                    operations["add"] = self.jellyfin.add_to_collection(
                         collection.jellyfin_id, to_add_list
                     )
-                    if not added_ok:
-                        raise RuntimeError(
-                            f"Failed to add items to collection '{collection.config.name}'"
-                        )
-                    logger.info(f"Added {len(to_add_list)} items to '{collection.config.name}'")
-
                 if to_remove_list:
-                    removed_ok = await self.jellyfin.remove_from_collection(
+                    operations["remove"] = self.jellyfin.remove_from_collection(
                         collection.jellyfin_id, to_remove_list
                     )
-                    if not removed_ok:
-                        raise RuntimeError(
-                            f"Failed to remove items from collection '{collection.config.name}'"
-                        )
+                gathered = await asyncio.gather(*operations.values())
+                results = dict(zip(operations, gathered, strict=True))
+                added_ok = results.get("add", True)
+                removed_ok = results.get("remove", True)
+                if not added_ok:
+                    raise RuntimeError(
+                        f"Failed to add items to collection '{collection.config.name}'"
+                    )
+                if not removed_ok:
+                    raise RuntimeError(
+                        f"Failed to remove items from collection '{collection.config.name}'"
+                    )
+                if to_add_list:
+                    logger.info(f"Added {len(to_add_list)} items to '{collection.config.name}'")
+                if to_remove_list:
                     logger.info(f"Removed {len(to_remove_list)} items from '{collection.config.name}'")
+                    current_ids_list = [
+                        item_id for item_id in current_ids_list if item_id in target_ids
+                    ]
+                self._collection_items[collection.jellyfin_id] = current_ids_list + to_add_list
 
             # Update report
             report.items_added_to_collection = len(to_add_list)
             report.items_removed_from_collection = len(to_remove_list)
 
-            # Update metadata (including DisplayOrder for Jellyfin sorting)
-            display_order = self._get_jellyfin_display_order(collection.config.collection_order)
-            await self.jellyfin.update_collection_metadata(
+        # Upload the poster (manual or AI-generated), update metadata (including
+        # DisplayOrder for Jellyfin sorting) and send missing items to
+        # Radarr/Sonarr concurrently; none depends on another's result
+        poster_task = self._upload_poster(collection, media_type, force_regenerate=force_poster)
+        if posters_only:
+            _, poster_path = await poster_task
+        else:
+            follow_ups: dict[str, Awaitable[Any]] = {"poster": poster_task}
+            follow_ups["metadata"] = self.jellyfin.update_collection_metadata(
                 collection.jellyfin_id,
                 overview=collection.config.summary,
                 sort_name=collection.config.sort_title,
-                display_order=display_order,
+                display_order=self._get_jellyfin_display_order(collection.config.collection_order),
             )
-
-        # Upload poster (manual or AI-generated)
-        _, poster_path = await self._upload_poster(collection, media_type, force_regenerate=force_poster)
-
-        # Add missing items to Radarr/Sonarr
-        if add_missing_to_arr and not posters_only:
-            radarr_count, sonarr_count = await self._add_missing_to_arr(collection, report)
-            report.items_sent_to_radarr = radarr_count
-            report.items_sent_to_sonarr = sonarr_count
+            if add_missing_to_arr:
+                follow_ups["arr"] = self._add_missing_to_arr(collection, report)
+            gathered = await asyncio.gather(*follow_ups.values(), return_exceptions=True)
+            for result in gathered:
+                if isinstance(result, BaseException):
+                    raise result
+            follow_up_results: dict[str, Any] = dict(zip(follow_ups, gathered, strict=True))
+            _, poster_path = follow_up_results["poster"]
+            if "arr" in follow_up_results:
+                report.items_sent_to_radarr, report.items_sent_to_sonarr = follow_up_results["arr"]
 
         return (len(to_add_list), len(to_remove_list), poster_path)
 
+    async def _get_collections_by_name(self) -> dict[str, list[dict[str, Any]]]:
+        """Get Jellyfin collections indexed by name, fetching them once per run."""
+        if self._collections_by_name is None:
+            by_name: dict[str, list[dict[str, Any]]] = {}
+            for jellyfin_collection in await self.jellyfin.get_collections():
+                name = jellyfin_collection.get("Name")
+                if name:
+                    by_name.setdefault(name, []).append(jellyfin_collection)
+            self._collections_by_name = by_name
+        return self._collections_by_name
+
+    async def _get_collection_items(self, collection_id: str) -> list[str]:
+        """Get item IDs in a Jellyfin collection, fetching them once per run."""
+        if collection_id not in self._collection_items:
+            self._collection_items[collection_id] = await self.jellyfin.get_collection_items(
+                collection_id
+            )
+        return self._collection_items[collection_id]
+
     async def _fetch_items(
         self,
         config: CollectionConfig,
         library_id: str,
         media_type: MediaType,
     ) -> list[MediaItem]:
-        """Fetch items from configured providers."""
-        items: list[MediaItem] = []
+        """
+        Fetch items from configured providers.
+
+        Provider calls are independent, so they run concurrently; results keep
+        the configured order. Every failing provider is logged, then the first
+        failure is re-raised: a partial item list would make a SYNC collection
+        remove everything the missing provider contributed.
+
+        Raises:
+            Exception: The first provider error, after all providers finished
+        """
+        is_movie = media_type == MediaType.MOVIE
+        # Sequence (covariant) so Movie/Series lists are accepted as media items
+        fetches: list[tuple[str, Awaitable[Sequence[MediaItem]]]] = []
 
         # TMDb Trending
         if config.tmdb_trending_weekly:
-            if media_type == MediaType.MOVIE:
-                items.extend(
-                    await self.tmdb.get_trending_movies("week", config.tmdb_trending_weekly)
-                )
-            else:
-                items.extend(
-                    await self.tmdb.get_trending_series("week", config.tmdb_trending_weekly)
-                )
+            get_trending = (
+                self.tmdb.get_trending_movies if is_movie else self.tmdb.get_trending_series
+            )
+            fetches.append(
+                ("tmdb_trending_weekly", get_trending("week", config.tmdb_trending_weekly))
+            )
 
         if config.tmdb_trending_daily:
-            if media_type == MediaType.MOVIE:
-                items.extend(
-                    await self.tmdb.get_trending_movies("day", config.tmdb_trending_daily)
-                )
-            else:
-                items.extend(
-                    await self.tmdb.get_trending_series("day", config.tmdb_trending_daily)
-                )
+            get_trending = (
+                self.tmdb.get_trending_movies if is_movie else self.tmdb.get_trending_series
+            )
+            fetches.append(
+                ("tmdb_trending_daily", get_trending("day", config.tmdb_trending_daily))
+            )
 
         # TMDb Popular
         if config.tmdb_popular:
-            if media_type == MediaType.MOVIE:
-                items.extend(await self.tmdb.get_popular_movies(config.tmdb_popular))
-            else:
-                items.extend(await self.tmdb.get_popular_series(config.tmdb_popular))
+            get_popular = self.tmdb.get_popular_movies if is_movie else self.tmdb.get_popular_series
+            fetches.append(("tmdb_popular", get_popular(config.tmdb_popular)))
 
         # TMDb Discover
         if config.tmdb_discover:
-            discover_items = await self._fetch_tmdb_discover(
-                config.tmdb_discover, media_type, config.filters
-            )
-            items.extend(discover_items)
+            fetches.append((
+                "tmdb_discover",
+                self._fetch_tmdb_discover(config.tmdb_discover, media_type, config.filters),
+            ))
 
         # TMDb List
         if config.tmdb_list:
-            list_ids = self._normalize_tmdb_list_ids(config.tmdb_list)
-            for list_id in list_ids:
-                items.extend(
-                    await self.tmdb.get_list(
-                        list_id=list_id,
-                        media_type=media_type,
-                    )
-                )
+            fetches.append(("tmdb_list", self._fetch_tmdb_lists(config.tmdb_list, media_type)))
 
         # IMDb
         if self.imdb:
             if config.imdb_chart:
-                items.extend(await self._fetch_imdb_chart(config.imdb_chart, media_type))
+                fetches.append(
+                    ("imdb_chart", self._fetch_imdb_chart(config.imdb_chart, media_type))
+                )
             if config.imdb_list:
-                items.extend(await self._fetch_imdb_list(config.imdb_list, media_type))
+                fetches.append(
+                    ("imdb_list", self._fetch_imdb_list(config.imdb_list, media_type))
+                )
         elif config.imdb_chart or config.imdb_list:
             logger.warning("IMDb builders configured but IMDb client is not available")
 
         # Arr tag lists
         if config.radarr_taglist:
-            if self.radarr and media_type == MediaType.MOVIE:
-                items.extend(await self._fetch_radarr_taglist(config.radarr_taglist))
+            if self.radarr and is_movie:
+                fetches.append(
+                    ("radarr_taglist", self._fetch_radarr_taglist(config.radarr_taglist))
+                )
             elif not self.radarr:
                 logger.warning("radarr_taglist configured but Radarr client is not available")
 
         if config.sonarr_taglist:
             if self.sonarr and media_type == MediaType.SERIES:
-                items.extend(await self._fetch_sonarr_taglist(config.sonarr_taglist))
+                fetches.append(
+                    ("sonarr_taglist", self._fetch_sonarr_taglist(config.sonarr_taglist))
+                )
             elif not self.sonarr:
                 logger.warning("sonarr_taglist configured but Sonarr client is not available")
 
         # Trakt
         if self.trakt:
             if config.trakt_trending:
-                if media_type == MediaType.MOVIE:
-                    items.extend(
-                        await self.trakt.get_trending_movies(config.trakt_trending)
-                    )
-                else:
-                    items.extend(
-                        await self.trakt.get_trending_series(config.trakt_trending)
-                    )
+                get_trakt_trending = (
+                    self.trakt.get_trending_movies if is_movie else self.trakt.get_trending_series
+                )
+                fetches.append(("trakt_trending", get_trakt_trending(config.trakt_trending)))
 
             if config.trakt_popular:
-                if media_type == MediaType.MOVIE:
-                    items.extend(
-                        await self.trakt.get_popular_movies(config.trakt_popular)
-                    )
-                else:
-                    items.extend(
-                        await self.trakt.get_popular_series(config.trakt_popular)
-                    )
+                get_trakt_popular = (
+                    self.trakt.get_popular_movies if is_movie else self.trakt.get_popular_series
+                )
+                fetches.append(("trakt_popular", get_trakt_popular(config.trakt_popular)))
 
             if config.trakt_chart:
-                chart_items = await self._fetch_trakt_chart(config.trakt_chart, media_type)
-                items.extend(chart_items)
+                fetches.append(
+                    ("trakt_chart", self._fetch_trakt_chart(config.trakt_chart, media_type))
+                )
 
             if config.trakt_list:
-                items.extend(await self._fetch_trakt_list(config.trakt_list, media_type))
+                fetches.append(
+                    ("trakt_list", self._fetch_trakt_list(config.trakt_list, media_type))
+                )
 
         # Library search
         if config.plex_search:
-            items.extend(
-                await self._fetch_plex_search(
+            fetches.append((
+                "plex_search",
+                self._fetch_plex_search(
                     plex_search=config.plex_search,
                     library_id=library_id,
                     media_type=media_type,
-                )
-            )
+                ),
+            ))
 
-        # Deduplicate by external IDs while preserving order
-        seen_keys: set[tuple[str, str]] = set()
-        unique_items: list[MediaItem] = []
+        results = await asyncio.gather(*(fetch for _, fetch in fetches), return_exceptions=True)
 
-        for item in items:
-            dedupe_key: Optional[tuple[str, str]] = None
-            if item.tmdb_id:
-                dedupe_key = ("tmdb", str(item.tmdb_id))
-            elif item.imdb_id:
-                dedupe_key = ("imdb", item.imdb_id)
-            elif item.tvdb_id:
-                dedupe_key = ("tvdb", str(item.tvdb_id))
-            elif item.title:
-                year = item.year if item.year else 0
-                dedupe_key = ("title", f"{item.title.lower()}::{year}")
-
-            if not dedupe_key:
+        items: list[MediaItem] = []
+        failures: list[BaseException] = []
+        for (source, _), result in zip(fetches, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to fetch {source} for '{config.name}': {result}")
+                failures.append(result)
                 continue
+            items.extend(result)
 
-            if dedupe_key in seen_keys:
-                continue
+        if failures:
+            raise failures[0]
 
-            seen_keys.add(dedupe_key)
-            unique_items.append(item)
+        # Deduplicate by external IDs while preserving order
+        return list(_iter_unique(items))
 
-        return unique_items
+    async def _fetch_tmdb_lists(
+        self,
+        tmdb_list: str | int | list[str | int],
+        media_type: MediaType,
+    ) -> list[MediaItem]:
+        """Fetch all configured TMDb lists concurrently, flattened in order."""
+        list_ids = self._normalize_tmdb_list_ids(tmdb_list)
+        list_results = await _gather_bounded(
+            self.tmdb.get_list(list_id=list_id, media_type=media_type)
+            for list_id in list_ids
+        )
+        return [item for list_items in list_results for item in list_items]
 
     async def _fetch_plex_search(
         self,
@@ -573,12 +862,8 @@ class CollectionBuilder:
         except (TypeError, ValueError):
             year_lte = None
 
-        # Load from Jellyfin through the existing client API, then filter locally.
-        library_items = await self.jellyfin.get_library_items(
-            library_id=library_id,
-            media_type=media_type,
-            limit=self.matcher.preload_limit,
-        )
+        # Reuse the library listing the matcher loads for this build, then filter locally.
+        library_items = await self.matcher.get_library_items(library_id, media_type)
 
         items: list[MediaItem] = []
         for lib_item in library_items:
@@ -659,61 +944,27 @@ class CollectionBuilder:
                 f"(multiplier: {limit_multiplier:.1f}x) to compensate for exclusion filters"
             )
 
+        is_movie = media_type == MediaType.MOVIE
+        param_names = _DISCOVER_MOVIE_PARAMS if is_movie else _DISCOVER_SERIES_PARAMS
+        params: dict[str, Any] = {
+            name: discover[key] for key, name in param_names.items() if key in discover
+        }
+
         # Merge filters into discover parameters
         # Priority: discover params > filter params (discover is more specific)
-        vote_avg_gte = discover.get("vote_average.gte")
-        if vote_avg_gte is None and filters and filters.vote_average_gte:
-            vote_avg_gte = filters.vote_average_gte
-
-        vote_count_gte = discover.get("vote_count.gte")
-        if vote_count_gte is None and filters and filters.tmdb_vote_count_gte:
-            vote_count_gte = filters.tmdb_vote_count_gte
-
-        if media_type == MediaType.MOVIE:
-            # Convert year filter to date filter if not already set
-            release_date_gte = discover.get("primary_release_date.gte")
-            if release_date_gte is None and filters and filters.year_gte:
-                release_date_gte = date(filters.year_gte, 1, 1)
-
-            return await self.tmdb.discover_movies(
-                sort_by=discover.get("sort_by", "popularity.desc"),
-                with_genres=discover.get("with_genres"),
-                without_genres=discover.get("without_genres"),
-                vote_average_gte=vote_avg_gte,
-                vote_average_lte=discover.get("vote_average.lte"),
-                vote_count_gte=vote_count_gte,
-                vote_count_lte=discover.get("vote_count.lte"),
-                primary_release_date_gte=release_date_gte,
-                primary_release_date_lte=discover.get("primary_release_date.lte"),
-                with_watch_providers=discover.get("with_watch_providers"),
-                watch_region=discover.get("watch_region"),
-                with_original_language=discover.get("with_original_language"),
-                with_release_type=discover.get("with_release_type"),
-                region=discover.get("region"),
-                limit=adjusted_limit,
-            )
-        else:
+        if filters:
+            if params.get("vote_average_gte") is None and filters.vote_average_gte:
+                params["vote_average_gte"] = filters.vote_average_gte
+            if params.get("vote_count_gte") is None and filters.tmdb_vote_count_gte:
+                params["vote_count_gte"] = filters.tmdb_vote_count_gte
             # Convert year filter to date filter if not already set
-            first_air_date_gte = discover.get("first_air_date.gte")
-            if first_air_date_gte is None and filters and filters.year_gte:
-                first_air_date_gte = date(filters.year_gte, 1, 1)
-
-            return await self.tmdb.discover_series(
-                sort_by=discover.get("sort_by", "popularity.desc"),
-                with_genres=discover.get("with_genres"),
-                without_genres=discover.get("without_genres"),
-                vote_average_gte=vote_avg_gte,
-                vote_count_gte=vote_count_gte,
-                vote_count_lte=discover.get("vote_count.lte"),
-                first_air_date_gte=first_air_date_gte,
-                first_air_date_lte=discover.get("first_air_date.lte"),
-                with_watch_providers=discover.get("with_watch_providers"),
-                watch_region=discover.get("watch_region"),
-                with_status=discover.get("with_status"),
-                with_original_language=discover.get("with_original_language"),
-                with_origin_country=discover.get("with_origin_country"),
-                limit=adjusted_limit,
-            )
+            date_gte = "primary_release_date_gte" if is_movie else "first_air_date_gte"
+            if params.get(date_gte) is None and filters.year_gte:
+                params[date_gte] = date(filters.year_gte, 1, 1)
+
+        if is_movie:
+            return await self.tmdb.discover_movies(**params, limit=adjusted_limit)
+        return await self.tmdb.discover_series(**params, limit=adjusted_limit)
 
     def _normalize_tmdb_list_ids(
         self,
@@ -740,7 +991,7 @@ class CollectionBuilder:
             return int(raw_value)
 
         # Accept full URL format like: https://www.themoviedb.org/list/710
-        match = re.search(r"/list/(\d+)", raw_value)
+        match = TMDB_LIST_URL_PATTERN.search(raw_value)
         if match:
             return int(match.group(1))
 
@@ -758,11 +1009,13 @@ class CollectionBuilder:
 
         chart_ids = self._normalize_imdb_ids(imdb_chart.get("list_ids"))
         limit = imdb_chart.get("limit")
-        imdb_ids: list[str] = []
+        chart_limit = int(limit) if limit else 250
 
-        for chart_id in chart_ids:
-            chart_limit = int(limit) if limit else 250
-            imdb_ids.extend(await self.imdb.get_chart(chart_id, limit=chart_limit))
+        # Fetch all charts concurrently, keeping configured chart order
+        results = await _gather_bounded(
+            self.imdb.get_chart(chart_id, limit=chart_limit) for chart_id in chart_ids
+        )
+        imdb_ids = [imdb_id for chart in results for imdb_id in chart]
 
         return await self._resolve_imdb_ids(imdb_ids, media_type, limit=limit)
 
@@ -777,11 +1030,13 @@ class CollectionBuilder:
 
         list_ids = self._normalize_imdb_ids(imdb_list.get("list_ids"))
         limit = imdb_list.get("limit")
-        imdb_ids: list[str] = []
+        list_limit = int(limit) if limit else 250
 
-        for list_id in list_ids:
-            list_limit = int(limit) if limit else 250
-            imdb_ids.extend(await self.imdb.get_list(list_id, limit=list_limit))
+        # Fetch all lists concurrently, keeping configured list order
+        results = await _gather_bounded(
+            self.imdb.get_list(list_id, limit=list_limit) for list_id in list_ids
+        )
+        imdb_ids = [imdb_id for imdb_list_ids in results for imdb_id in imdb_list_ids]
 
         return await self._resolve_imdb_ids(imdb_ids, media_type, limit=limit)
 
@@ -794,20 +1049,23 @@ class CollectionBuilder:
         limit = config.get("limit")
         max_items = int(limit) if limit else None
 
-        movies = await self.radarr.get_movies()
-        tag_map = {
-            tag.get("id"): str(tag.get("label", "")).strip().lower()
-            for tag in await self.radarr.get_tags()
-        }
+        if self._radarr_tags is None:
+            self._radarr_tags = self._build_tag_map(await self.radarr.get_tags())
         tag_set = {tag.lower() for tag in tags}
+        allowed_tag_ids = {
+            tag_id for tag_id, label in self._radarr_tags.items() if label and label in tag_set
+        }
+        if not allowed_tag_ids:
+            logger.warning(f"[Radarr] Taglist ({', '.join(tags)}): no matching tags found")
+            return []
+
+        if self._radarr_movies is None:
+            self._radarr_movies = await self.radarr.get_movies()
+        movies = self._radarr_movies
 
         results: list[MediaItem] = []
         for movie in movies:
-            movie_tag_ids = movie.get("tags", [])
-            movie_tag_names = {
-                tag_map[tag_id] for tag_id in movie_tag_ids if tag_id in tag_map and tag_map[tag_id]
-            }
-            if not movie_tag_names.intersection(tag_set):
+            if allowed_tag_ids.isdisjoint(movie.get("tags", [])):
                 continue
 
             results.append(
@@ -836,20 +1094,23 @@ class CollectionBuilder:
         limit = config.get("limit")
         max_items = int(limit) if limit else None
 
-        series_list = await self.sonarr.get_series()
-        tag_map = {
-            tag.get("id"): str(tag.get("label", "")).strip().lower()
-            for tag in await self.sonarr.get_tags()
-        }
+        if self._sonarr_tags is None:
+            self._sonarr_tags = self._build_tag_map(await self.sonarr.get_tags())
         tag_set = {tag.lower() for tag in tags}
+        allowed_tag_ids = {
+            tag_id for tag_id, label in self._sonarr_tags.items() if label and label in tag_set
+        }
+        if not allowed_tag_ids:
+            logger.warning(f"[Sonarr] Taglist ({', '.join(tags)}): no matching tags found")
+            return []
+
+        if self._sonarr_series is None:
+            self._sonarr_series = await self.sonarr.get_series()
+        series_list = self._sonarr_series
 
         results: list[MediaItem] = []
         for series in series_list:
-            series_tag_ids = series.get("tags", [])
-            series_tag_names = {
-                tag_map[tag_id] for tag_id in series_tag_ids if tag_id in tag_map and tag_map[tag_id]
-            }
-            if not series_tag_names.intersection(tag_set):
+            if allowed_tag_ids.isdisjoint(series.get("tags", [])):
                 continue
 
             results.append(
@@ -870,6 +1131,14 @@ class CollectionBuilder:
         logger.info(f"[Sonarr] Taglist ({', '.join(tags)}): fetched {len(results)} items")
         return results
 
+    def _build_tag_map(self, tags: list[dict[str, Any]]) -> dict[int, str]:
+        """Map Radarr/Sonarr tag IDs to normalized labels."""
+        return {
+            tag["id"]: str(tag.get("label", "")).strip().lower()
+            for tag in tags
+            if tag.get("id") is not None
+        }
+
     def _normalize_imdb_ids(self, values: Any) -> list[str]:
         """Normalize IMDb chart/list ID values into a clean list."""
         if values is None:
@@ -891,19 +1160,28 @@ class CollectionBuilder:
         media_type: MediaType,
         limit: Optional[int] = None,
     ) -> list[MediaItem]:
-        """Resolve IMDb IDs to TMDb media items."""
+        """
+        Resolve IMDb IDs to TMDb media items.
+
+        Lookups run concurrently. With a limit, IDs are resolved in windows
+        sized to the number of items still needed, so unresolvable IDs are
+        topped up without fetching far past the limit.
+        """
         resolved: list[MediaItem] = []
-        seen: set[str] = set()
+        pending = list(dict.fromkeys(imdb_ids))
         max_items = int(limit) if limit else None
 
-        for imdb_id in imdb_ids:
-            if imdb_id in seen:
-                continue
-            seen.add(imdb_id)
+        while pending:
+            if max_items:
+                window_size = max_items - len(resolved)
+                window, pending = pending[:window_size], pending[window_size:]
+            else:
+                window, pending = pending, []
 
-            item = await self.tmdb.find_by_imdb_id(imdb_id, media_type=media_type)
-            if item:
-                resolved.append(item)
+            items = await _gather_bounded(
+                self.tmdb.find_by_imdb_id(imdb_id, media_type=media_type) for imdb_id in window
+            )
+            resolved.extend(item for item in items if item)
 
             if max_items and len(resolved) >= max_items:
                 break
@@ -923,25 +1201,15 @@ class CollectionBuilder:
         period = chart_config.get("time_period", "weekly")
         limit = chart_config.get("limit", 20)
 
-        if chart == "watched":
-            if media_type == MediaType.MOVIE:
-                return await self.trakt.get_watched_movies(period, limit)
-            else:
-                return await self.trakt.get_watched_series(period, limit)
-
-        if chart == "trending":
-            if media_type == MediaType.MOVIE:
-                return await self.trakt.get_trending_movies(limit)
-            else:
-                return await self.trakt.get_trending_series(limit)
-
-        if chart == "popular":
-            if media_type == MediaType.MOVIE:
-                return await self.trakt.get_popular_movies(limit)
-            else:
-                return await self.trakt.get_popular_series(limit)
+        methods = self._TRAKT_CHARTS.get(chart)
+        if not methods:
+            return []
 
-        return []
+        movie_method, series_method, uses_period = methods
+        method = movie_method if media_type == MediaType.MOVIE else series_method
+        fetch = getattr(self.trakt, method)
+        items: list[MediaItem] = await (fetch(period, limit) if uses_period else fetch(limit))
+        return items
 
     async def _fetch_trakt_list(
         self,
@@ -970,7 +1238,7 @@ class CollectionBuilder:
         if not value:
             return None
 
-        match = re.search(r"trakt\.tv/users/([^/]+)/lists/([^/?#]+)", value, re.IGNORECASE)
+        match = TRAKT_LIST_URL_PATTERN.search(value)
         if match:
             return (match.group(1), match.group(2))
 
@@ -989,18 +1257,9 @@ class CollectionBuilder:
                 tokens.add(genre)
                 continue
 
-            genre_str = str(genre).strip()
-            if not genre_str:
-                continue
-
-            if genre_str.isdigit():
-                tokens.add(int(genre_str))
-                continue
-
-            normalized = genre_str.lower().replace("-", " ").replace("_", " ")
-            normalized = " ".join(normalized.split())
-            if normalized:
-                tokens.add(normalized)
+            token = _genre_token(str(genre))
+            if token is not None:
+                tokens.add(token)
 
         return tokens
 
@@ -1011,66 +1270,96 @@ class CollectionBuilder:
     ) -> list[MediaItem]:
         """Apply collection filters to items."""
         filters = config.filters
+        limit = config.limit
         filtered = []
 
+        # Bind thresholds and normalize exclusion lists once instead of per item
+        year_gte = filters.year_gte
+        year_lte = filters.year_lte
+        # Both rating thresholds apply to vote_average, so only the higher one matters
+        rating_gte = max(filters.vote_average_gte or 0, filters.critic_rating_gte or 0)
+        vote_count_gte = filters.tmdb_vote_count_gte
+        country_not = frozenset(filters.country_not)
+        origin_country_not = frozenset(filters.origin_country_not)
+        original_language_not = frozenset(filters.original_language_not)
+        exclude_genres = bool(filters.without_genres)
+        require_genres = bool(filters.with_genres)
+        excluded_genres = frozenset(self._normalize_genre_tokens(filters.without_genres))
+        required_genres = frozenset(self._normalize_genre_tokens(filters.with_genres))
+        check_genres = exclude_genres or require_genres
+
+        if not (
+            year_gte
+            or year_lte
+            or rating_gte
+            or vote_count_gte
+            or country_not
+            or origin_country_not
+            or original_language_not
+            or check_genres
+        ):
+            return items[:limit] if limit else list(items)
+
+        # Checks run cheapest and most selective first (year, country/language sets,
+        # then ratings), leaving genre normalization for items that got that far.
+        # Debug messages use loguru's deferred formatting so skipped items cost no
+        # string formatting unless debug logging is enabled.
         for item in items:
             # Year filters
-            if filters.year_gte and item.year and item.year < filters.year_gte:
-                logger.debug(f"Filtered out '{item.title}': year={item.year} < {filters.year_gte}")
+            if year_gte and item.year and item.year < year_gte:
+                logger.debug("Filtered out '{}': year={} < {}", item.title, item.year, year_gte)
                 continue
-            if filters.year_lte and item.year and item.year > filters.year_lte:
-                logger.debug(f"Filtered out '{item.title}': year={item.year} > {filters.year_lte}")
+            if year_lte and item.year and item.year > year_lte:
+                logger.debug("Filtered out '{}': year={} > {}", item.title, item.year, year_lte)
                 continue
 
-            # Rating filters
-            if filters.vote_average_gte and item.vote_average:
-                if item.vote_average < filters.vote_average_gte:
+            # Country filters
+            if country_not and item.original_country:
+                if item.original_country in country_not:
+                    logger.debug("Filtered out '{}': country={}", item.title, item.original_country)
                     continue
-            if filters.critic_rating_gte and item.vote_average:
-                if item.vote_average < filters.critic_rating_gte:
+            if origin_country_not and item.original_country:
+                if item.original_country in origin_country_not:
+                    logger.debug(
+                        "Filtered out '{}': origin_country={}", item.title, item.original_country
+                    )
                     continue
 
-            # Vote count filters
-            if filters.tmdb_vote_count_gte and item.vote_count:
-                if item.vote_count < filters.tmdb_vote_count_gte:
+            # Language filter (for example, excluding specific original languages)
+            if original_language_not and item.original_language:
+                if item.original_language in original_language_not:
+                    logger.debug(
+                        "Filtered out '{}': language={}", item.title, item.original_language
+                    )
                     continue
 
-            # Country filters
-            if filters.country_not and item.original_country:
-                if item.original_country in filters.country_not:
-                    logger.debug(f"Filtered out '{item.title}': country={item.original_country}")
-                    continue
-            if filters.origin_country_not and item.original_country:
-                if item.original_country in filters.origin_country_not:
-                    logger.debug(f"Filtered out '{item.title}': origin_country={item.original_country}")
+            # Rating filters
+            if rating_gte and item.vote_average:
+                if item.vote_average < rating_gte:
                     continue
 
-            # Language filter (for example, excluding specific original languages)
-            if filters.original_language_not and item.original_language:
-                if item.original_language in filters.original_language_not:
-                    logger.debug(f"Filtered out '{item.title}': language={item.original_language}")
+            # Vote count filters
+            if vote_count_gte and item.vote_count:
+                if item.vote_count < vote_count_gte:
                     continue
 
-            item_genres = self._normalize_genre_tokens(item.genres)
-
             # Genre filters support both TMDb IDs and provider genre names.
-            if filters.without_genres and item.genres:
-                excluded_genres = self._normalize_genre_tokens(filters.without_genres)
-                if item_genres.intersection(excluded_genres):
-                    logger.debug(f"Filtered out '{item.title}': excluded genre")
+            # Item genres are only normalized when a genre filter applies.
+            if check_genres and item.genres:
+                item_genres = self._normalize_genre_tokens(item.genres)
+
+                if exclude_genres and not excluded_genres.isdisjoint(item_genres):
+                    logger.debug("Filtered out '{}': excluded genre", item.title)
                     continue
 
-            if filters.with_genres and item.genres:
-                required_genres = self._normalize_genre_tokens(filters.with_genres)
-                if not item_genres.intersection(required_genres):
-                    logger.debug(f"Filtered out '{item.title}': missing required genre")
+                if require_genres and required_genres.isdisjoint(item_genres):
+                    logger.debug("Filtered out '{}': missing required genre", item.title)
                     continue
 
             filtered.append(item)
-
-        # Apply limit
-        if config.limit:
-            filtered = filtered[: config.limit]
+            # Stop scanning once the limit is reached; later items would be sliced off
+            if limit and len(filtered) >= limit:
+                break
 
         return filtered
 
@@ -1084,7 +1373,8 @@ class CollectionBuilder:
 
         For 'custom' order, items are kept in their original source order.
         For other orders, items are sorted and will be added to Jellyfin
-        in that order (achieving the desired display order).
+        in that order (achieving the desired display order). 'random' order
+        is shuffled by the caller on the target ID list instead.
 
         Args:
             items: Collection items to sort
@@ -1097,46 +1387,9 @@ class CollectionBuilder:
             # Keep original order from source
             return items
 
-        if order == CollectionOrder.RANDOM:
-            shuffled = items.copy()
-            random.shuffle(shuffled)
-            return shuffled
-
-        # Define sort key functions
-        def sort_key_name(x: CollectionItem) -> str:
-            return (x.sort_name or x.title).lower()
-
-        def sort_key_premiere(x: CollectionItem) -> tuple:
-            # Use year as fallback, sort descending (newest first)
-            d = x.premiere_date or (date(x.year, 1, 1) if x.year else date.min)
-            return (d, x.title)
-
-        def sort_key_rating(x: CollectionItem) -> tuple:
-            # Sort descending (highest first) - use negative
-            return (-(x.community_rating or 0), x.title)
-
-        def sort_key_critic(x: CollectionItem) -> tuple:
-            return (-(x.critic_rating or 0), x.title)
-
-        def sort_key_created(x: CollectionItem) -> tuple:
-            return (x.date_created or date.min, x.title)
-
-        sort_keys = {
-            CollectionOrder.SORT_NAME: sort_key_name,
-            CollectionOrder.PREMIERE_DATE: sort_key_premiere,
-            CollectionOrder.COMMUNITY_RATING: sort_key_rating,
-            CollectionOrder.CRITIC_RATING: sort_key_critic,
-            CollectionOrder.DATE_CREATED: sort_key_created,
-        }
-
-        key_func = sort_keys.get(order)
+        key_func = _SORT_KEYS.get(order)
         if key_func:
-            # Descending for dates (newest first)
-            reverse = order in {
-                CollectionOrder.PREMIERE_DATE,
-                CollectionOrder.DATE_CREATED,
-            }
-            return sorted(items, key=key_func, reverse=reverse)
+            return sorted(items, key=key_func, reverse=order in _SORT_DESCENDING)
 
         return items
 
@@ -1157,18 +1410,7 @@ class CollectionBuilder:
         Returns:
             Jellyfin DisplayOrder string value
         """
-        order_mapping = {
-            CollectionOrder.CUSTOM: "Default",
-            CollectionOrder.SORT_NAME: "SortName",
-            # Keep app-level newest-first insertion order for release date.
-            # Jellyfin's PremiereDate display order is often oldest-first.
-            CollectionOrder.PREMIERE_DATE: "Default",
-            CollectionOrder.DATE_CREATED: "DateCreated",
-            CollectionOrder.COMMUNITY_RATING: "CommunityRating",
-            CollectionOrder.CRITIC_RATING: "CommunityRating",  # Jellyfin uses same field
-            CollectionOrder.RANDOM: "Default",  # No random in Jellyfin, use default
-        }
-        return order_mapping.get(order, "Default")
+        return _DISPLAY_ORDERS.get(order, "Default")
 
     async def _upload_poster(
         self,
@@ -1193,62 +1435,35 @@ class CollectionBuilder:
         if not collection.jellyfin_id:
             return False, None
 
-        settings = get_settings()
+        settings = self.settings
         poster_path: Optional[Path] = None
 
-        # 1. Force regenerate with AI if requested and enabled
-        if force_regenerate and self.poster_generator and settings.openai.enabled:
-            # Map media type to category
-            category = self._get_poster_category(collection.library_name, media_type)
-
-            # Use source_items (original provider order) for poster generation
-            # This ensures the poster reflects the true trending list, not just available items
-            poster_items = collection.source_items if collection.source_items else collection.items
-            media_items = self._collection_items_to_media_items(poster_items)
+        ai_enabled = self.poster_generator is not None and settings.openai.enabled
 
-            logger.info(f"Force regenerating AI poster for '{collection.config.name}'...")
-            poster_path = await self.poster_generator.generate_poster(
-                config=collection.config,
-                items=media_items,
-                category=category,
-                library=collection.library_name,
-                force_regenerate=True,
-                explicit_refs=settings.openai.explicit_refs,
+        # 1. Force regenerate with AI if requested and enabled
+        if force_regenerate and ai_enabled:
+            poster_path = await self._generate_ai_poster(
+                collection, media_type, force_regenerate=True
             )
-            if poster_path:
-                logger.success(f"Generated AI poster: {poster_path.name}")
 
         # 2. Check for manually configured poster
         elif collection.config.poster:
-            manual_path = settings.get_posters_path() / collection.config.poster
+            manual_path = self.posters_path / collection.config.poster
             if manual_path.exists():
                 poster_path = manual_path
-            elif self.poster_generator and settings.openai.enabled:
+            elif ai_enabled:
                 # Manual poster not found, fallback to AI
                 logger.debug(f"Manual poster '{collection.config.poster}' not found, using AI")
 
         # 3. If no manual poster and AI generation enabled, generate one
-        if not poster_path and self.poster_generator and settings.openai.enabled:
-            # Map media type to category
-            category = self._get_poster_category(collection.library_name, media_type)
-
-            # Use source_items (original provider order) for poster generation
-            poster_items = collection.source_items if collection.source_items else collection.items
-            media_items = self._collection_items_to_media_items(poster_items)
-
-            logger.info(f"Generating AI poster for '{collection.config.name}'...")
-            poster_path = await self.poster_generator.generate_poster(
-                config=collection.config,
-                items=media_items,
-                category=category,
-                library=collection.library_name,
-                force_regenerate=False,
-                explicit_refs=settings.openai.explicit_refs,
-            )
-            if poster_path:
-                logger.success(f"Generated AI poster: {poster_path.name}")
-
-        if not poster_path or not poster_path.exists():
+        #    (also reuses the cached poster when a forced regeneration failed)
+        if not poster_path and ai_enabled:
+            poster_path = await self._generate_ai_poster(collection, media_type)
+
+        # Every path above is known to exist: the manual poster was just checked and
+        # the generator only returns files it found or wrote. A file removed in the
+        # meantime is handled by the FileNotFoundError branch below.
+        if not poster_path:
             return False, None
 
         try:
@@ -1263,7 +1478,8 @@ class CollectionBuilder:
             logger.warning(
                 f"Poster file not found for '{collection.config.name}': {poster_path}"
             )
-            return False, poster_path
+            # Same result as before the upload-time check: no poster to report
+            return False, None
         except ValueError as e:
             logger.warning(f"Invalid poster for '{collection.config.name}': {e}")
             return False, poster_path
@@ -1271,6 +1487,53 @@ class CollectionBuilder:
             logger.error(f"Failed to upload poster for '{collection.config.name}': {e}")
             return False, poster_path
 
+    async def _generate_ai_poster(
+        self,
+        collection: Collection,
+        media_type: MediaType,
+        force_regenerate: bool = False,
+    ) -> Optional[Path]:
+        """
+        Generate (or reuse a cached) AI poster for a collection.
+
+        Args:
+            collection: Collection to generate the poster for
+            media_type: Type of media (for AI category mapping)
+            force_regenerate: Ignore any cached poster
+
+        Returns:
+            Path to the poster, or None if generation failed
+        """
+        if not self.poster_generator:
+            return None
+
+        settings = self.settings
+
+        # Map media type to category
+        category = self._get_poster_category(collection.library_name, media_type)
+
+        # Use source_items (original provider order) for poster generation
+        # This ensures the poster reflects the true trending list, not just available items
+        # The generator only reads the leading items, so only those are converted
+        poster_items = collection.source_items if collection.source_items else collection.items
+        media_items = self._collection_items_to_media_items(poster_items[:MAX_CONTEXT_ITEMS])
+
+        if force_regenerate:
+            logger.info(f"Force regenerating AI poster for '{collection.config.name}'...")
+        else:
+            logger.info(f"Generating AI poster for '{collection.config.name}'...")
+        poster_path = await self.poster_generator.generate_poster(
+            config=collection.config,
+            items=media_items,
+            category=category,
+            library=collection.library_name,
+            force_regenerate=force_regenerate,
+            explicit_refs=settings.openai.explicit_refs,
+        )
+        if poster_path:
+            logger.success(f"Generated AI poster: {poster_path.name}")
+        return poster_path
+
     def _get_poster_category(self, library_name: str, media_type: MediaType) -> str:
         """
         Map library/media type to poster category.
@@ -1282,17 +1545,7 @@ class CollectionBuilder:
         Returns:
             Category string: FILMS, SÉRIES, or CARTOONS
         """
-        lib_lower = library_name.lower()
-
-        # Check for cartoon/animation library
-        if any(x in lib_lower for x in ["cartoon", "animation", "anime", "enfant", "kids"]):
-            return "CARTOONS"
-
-        # Based on media type
-        if media_type == MediaType.SERIES:
-            return "SÉRIES"
-
-        return "FILMS"
+        return _poster_category(library_name, media_type)
 
     def _collection_items_to_media_items(
         self,
@@ -1309,27 +1562,16 @@ class CollectionBuilder:
         Returns:
             List of MediaItem objects
         """
-        media_items = []
-        for item in items:
-            media_type = MediaType.SERIES if item.media_type == "series" else MediaType.MOVIE
-            if media_type == MediaType.MOVIE:
-                media_item = Movie(
-                    tmdb_id=item.tmdb_id,
-                    title=item.title,
-                    year=item.year,
-                    overview=item.overview,
-                    genres=item.genres,
-                )
-            else:
-                media_item = Series(
-                    tmdb_id=item.tmdb_id,
-                    title=item.title,
-                    year=item.year,
-                    overview=item.overview,
-                    genres=item.genres,
-                )
-            media_items.append(media_item)
-        return media_items
+        return [
+            _MEDIA_CLASS_BY_TYPE.get(item.media_type, Movie)(
+                tmdb_id=item.tmdb_id,
+                title=item.title,
+                year=item.year,
+                overview=item.overview,
+                genres=item.genres or [],
+            )
+            for item in items
+        ]
 
     async def _add_missing_to_arr(
         self,
@@ -1353,55 +1595,123 @@ class CollectionBuilder:
 
         # Get library-level settings (item-level tag takes priority over library-level)
         config = collection.config
+        # Sonarr settings: item_sonarr_tag > sonarr_tag > client default
+        sonarr_tag = config.item_sonarr_tag or config.sonarr_tag
+        sonarr_tags = [sonarr_tag] if sonarr_tag else None
+        # Radarr settings: item_radarr_tag > radarr_tag > client default
+        radarr_tag = config.item_radarr_tag or config.radarr_tag
+        radarr_tags = [radarr_tag] if radarr_tag else None
+
+        sonarr = self.sonarr
+        radarr = self.radarr
+
+        # Use media_type to determine Sonarr vs Radarr
+        series_missing = (
+            [item for item in missing if item.media_type == "series"] if sonarr else []
+        )
+        movies_to_add: list[tuple[CollectionItem, int]] = (
+            [
+                (item, item.tmdb_id)
+                for item in missing
+                if item.media_type != "series" and item.tmdb_id
+            ]
+            if radarr
+            else []
+        )
 
-        for item in missing:
-            # Use media_type to determine Sonarr vs Radarr
-            is_series = item.media_type == "series"
-
-            if is_series and self.sonarr:
-                # Sonarr settings: item_sonarr_tag > sonarr_tag > client default
-                tag = config.item_sonarr_tag or config.sonarr_tag
-                tags = [tag] if tag else None
-
-                # Get tvdb_id - fetch from TMDb if not already available
-                tvdb_id = item.tvdb_id
-                if not tvdb_id and item.tmdb_id:
-                    # Fetch series details from TMDb to get tvdb_id
-                    series_details = await self.tmdb.get_series_details(item.tmdb_id)
-                    if series_details:
-                        tvdb_id = series_details.tvdb_id
-
-                if not tvdb_id:
-                    logger.warning(f"Cannot add '{item.title}' to Sonarr: no TVDB ID found")
-                    continue
+        # Fetch series details from TMDb concurrently to get missing TVDB IDs.
+        # Lookups are deduplicated and remembered, since the mapping never changes.
+        tvdb_by_tmdb = self._tvdb_by_tmdb
+        lookup_ids = list(
+            dict.fromkeys(
+                item.tmdb_id
+                for item in series_missing
+                if not item.tvdb_id and item.tmdb_id and item.tmdb_id not in tvdb_by_tmdb
+            )
+        )
+        details = await _gather_bounded(
+            self.tmdb.get_series_details(tmdb_id) for tmdb_id in lookup_ids
+        )
+        for tmdb_id, series in zip(lookup_ids, details, strict=True):
+            if series and series.tvdb_id:
+                tvdb_by_tmdb[tmdb_id] = series.tvdb_id
+
+        series_to_add: list[tuple[CollectionItem, int]] = []
+        for item in series_missing:
+            tvdb_id = item.tvdb_id or (tvdb_by_tmdb.get(item.tmdb_id) if item.tmdb_id else None)
+            if not tvdb_id:
+                logger.warning(f"Cannot add '{item.title}' to Sonarr: no TVDB ID found")
+                continue
+            series_to_add.append((item, tvdb_id))
+
+        if not series_to_add and not movies_to_add:
+            return (0, 0)
 
-                try:
-                    await self.sonarr.add_series(
+        # Resolve tags up front so concurrent adds don't race to create the same tag
+        try:
+            if sonarr and series_to_add:
+                for tag_name in sonarr_tags or [sonarr.default_tag]:
+                    await sonarr.get_or_create_tag(tag_name)
+            if radarr and movies_to_add:
+                for tag_name in radarr_tags or [radarr.default_tag]:
+                    await radarr.get_or_create_tag(tag_name)
+        except Exception as e:
+            logger.warning(f"Failed to resolve Arr tags before adding items: {e}")
+
+        # Load blocklists/exclusions once, rather than in every concurrent add
+        try:
+            if sonarr and series_to_add:
+                await sonarr.load_blocklist()
+                await sonarr.load_exclusions()
+            if radarr and movies_to_add:
+                await radarr.load_blocklist()
+                await radarr.load_exclusions()
+        except Exception as e:
+            logger.warning(f"Failed to load Arr blocklists before adding items: {e}")
+
+        requests: list[tuple[str, str, Awaitable[Any]]] = []
+        if sonarr:
+            requests.extend(
+                (
+                    "Sonarr",
+                    item.title,
+                    sonarr.add_series(
                         tvdb_id=tvdb_id,
                         root_folder=config.sonarr_root_folder,
                         quality_profile=config.sonarr_quality_profile,
-                        tags=tags,
-                    )
-                    sonarr_count += 1
-                    report.sonarr_titles.append(item.title)
-                except Exception as e:
-                    logger.warning(f"Failed to add '{item.title}' to Sonarr: {e}")
-
-            elif not is_series and self.radarr and item.tmdb_id:
-                # Radarr settings: item_radarr_tag > radarr_tag > client default
-                tag = config.item_radarr_tag or config.radarr_tag
-                tags = [tag] if tag else None
-
-                try:
-                    await self.radarr.add_movie(
-                        tmdb_id=item.tmdb_id,
+                        tags=sonarr_tags,
+                    ),
+                )
+                for item, tvdb_id in series_to_add
+            )
+        if radarr:
+            requests.extend(
+                (
+                    "Radarr",
+                    item.title,
+                    radarr.add_movie(
+                        tmdb_id=tmdb_id,
                         root_folder=config.radarr_root_folder,
                         quality_profile=config.radarr_quality_profile,
-                        tags=tags,
-                    )
-                    radarr_count += 1
-                    report.radarr_titles.append(item.title)
-                except Exception as e:
-                    logger.warning(f"Failed to add '{item.title}' to Radarr: {e}")
+                        tags=radarr_tags,
+                    ),
+                )
+                for item, tmdb_id in movies_to_add
+            )
+
+        results = await _gather_bounded(
+            (request for _, _, request in requests),
+            limit=MAX_CONCURRENT_ARR_REQUESTS,
+            return_exceptions=True,
+        )
+        for (service, title, _), result in zip(requests, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to add '{title}' to {service}: {result}")
+            elif service == "Sonarr":
+                sonarr_count += 1
+                report.sonarr_titles.append(title)
+            else:
+                radarr_count += 1
+                report.radarr_titles.append(title)
 
         return (radarr_count, sonarr_count)
@@ -1,5 +1,9 @@
 """Service for matching media items between providers and Jellyfin library."""
 
+import asyncio
+import functools
+import re
+from types import MappingProxyType
 from typing import Optional
 
 from loguru import logger
@@ -7,10 +11,21 @@ from loguru import logger
 from jfc.clients.jellyfin import JellyfinClient
 from jfc.models.media import LibraryItem, MediaItem, MediaType
 
+# Leading English/French article stripped before title comparison
+ARTICLE_PATTERN = re.compile(r"^(?:the|an?|les?|la|une?)\s+")
+# Anything other than letters, digits and whitespace (\w alone would keep "_")
+SPECIAL_CHARS_PATTERN = re.compile(r"[^\w\s]|_")
+
+# Shared read-only stand-in for a library index that hasn't been loaded
+_EMPTY_INDEX: MappingProxyType = MappingProxyType({})
+
 
 class MediaMatcher:
     """Service for matching media items to Jellyfin library."""
 
+    # Maximum concurrent Jellyfin title searches during batch matching
+    MAX_CONCURRENT_SEARCHES = 10
+
     def __init__(self, jellyfin: JellyfinClient, preload_limit: int = 50000):
         """
         Initialize media matcher.
@@ -21,15 +36,29 @@ class MediaMatcher:
         """
         self.jellyfin = jellyfin
         self.preload_limit = preload_limit
-        self._cache: dict[int, Optional[LibraryItem]] = {}  # tmdb_id -> LibraryItem
-        self._library_loaded: dict[str, bool] = {}  # library_id -> loaded
+        self._hits: dict[int, LibraryItem] = {}  # tmdb_id -> matched LibraryItem
+        self._misses: set[int] = set()  # tmdb_ids known to be missing
+        self._library_loaded: set[str] = set()  # loaded library IDs
+        self._load_locks: dict[str, asyncio.Lock] = {}  # library_id -> load lock
+        self._library_listing: dict[str, list[LibraryItem]] = {}  # library_id -> all items
         self._library_items: dict[str, dict[int, LibraryItem]] = {}  # library_id -> {tmdb_id -> item}
+        self._library_imdb: dict[str, dict[str, LibraryItem]] = {}  # library_id -> {imdb_id -> item}
+        self._library_tvdb: dict[str, dict[int, LibraryItem]] = {}  # library_id -> {tvdb_id -> item}
+        # library_id -> {normalized title -> items}, built on first title lookup
+        self._library_titles: dict[str, dict[str, list[LibraryItem]]] = {}
 
     async def _ensure_library_loaded(self, library_id: str, media_type: Optional[MediaType] = None) -> None:
         """Load all items from a library into cache."""
         if library_id in self._library_loaded:
             return
 
+        # Concurrent callers for the same library wait for a single load
+        async with self._load_locks.setdefault(library_id, asyncio.Lock()):
+            if library_id not in self._library_loaded:
+                await self._load_library(library_id, media_type)
+
+    async def _load_library(self, library_id: str, media_type: Optional[MediaType]) -> None:
+        """Fetch a library listing and build the lookup indexes."""
         logger.info(f"[Jellyfin] Loading library {library_id} into cache...")
 
         items = await self.jellyfin.get_library_items(
@@ -38,18 +67,70 @@ class MediaMatcher:
             limit=self.preload_limit,
         )
 
-        # Index by TMDb ID
-        self._library_items[library_id] = {}
-        for item in items:
-            if item.tmdb_id:
-                self._library_items[library_id][item.tmdb_id] = item
+        self._library_listing[library_id] = items
 
-        self._library_loaded[library_id] = True
+        # Index by TMDb ID, plus IMDb/TVDB IDs for items resolved without TMDb
+        self._library_items[library_id] = {item.tmdb_id: item for item in items if item.tmdb_id}
+        self._library_imdb[library_id] = {item.imdb_id: item for item in items if item.imdb_id}
+        self._library_tvdb[library_id] = {item.tvdb_id: item for item in items if item.tvdb_id}
+
+        self._library_loaded.add(library_id)
         logger.info(
             f"[Jellyfin] Loaded {len(items)} items from library, "
             f"{len(self._library_items[library_id])} with TMDb IDs"
         )
 
+    async def prime(self, library_id: str, media_type: Optional[MediaType] = None) -> None:
+        """
+        Load a library into the match cache ahead of lookups.
+
+        Args:
+            library_id: Library ID to load
+            media_type: Optional media type to restrict the listing to
+        """
+        await self._ensure_library_loaded(library_id, media_type)
+
+    async def warm(self, libraries: dict[str, Optional[MediaType]]) -> None:
+        """
+        Load several libraries into the match cache concurrently.
+
+        Failures are logged; the lazy load on first lookup remains as fallback.
+
+        Args:
+            libraries: Library ID -> media type to restrict each listing to
+        """
+        library_ids = [
+            library_id for library_id in libraries if library_id not in self._library_loaded
+        ]
+        results = await asyncio.gather(
+            *(
+                self._ensure_library_loaded(library_id, libraries[library_id])
+                for library_id in library_ids
+            ),
+            return_exceptions=True,
+        )
+        for library_id, result in zip(library_ids, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"[Jellyfin] Failed to preload library {library_id}: {result}")
+
+    async def get_library_items(
+        self,
+        library_id: str,
+        media_type: Optional[MediaType] = None,
+    ) -> list[LibraryItem]:
+        """
+        Get all items of a library, reusing the listing loaded for matching.
+
+        Args:
+            library_id: Library ID to list
+            media_type: Optional media type to restrict the listing to
+
+        Returns:
+            Library items (up to the preload limit)
+        """
+        await self._ensure_library_loaded(library_id, media_type)
+        return self._library_listing[library_id]
+
     async def find_in_library(
         self,
         item: MediaItem,
@@ -65,54 +146,179 @@ class MediaMatcher:
         Returns:
             LibraryItem if found, None otherwise
         """
-        year_str = f" ({item.year})" if item.year else ""
-        tmdb_str = f"tmdb:{item.tmdb_id}" if item.tmdb_id else "no-tmdb"
-
         # Ensure library is loaded into cache
         if library_id:
             await self._ensure_library_loaded(library_id, item.media_type)
 
+        lib_item = self._find_cached(item, library_id)
+        if lib_item or item.tmdb_id:
+            return lib_item
+
+        # Fall back to search by title and year (for items without TMDb ID)
+        return await self._search_by_title(item)
+
+    async def find_many(
+        self,
+        items: list[MediaItem],
+        library_id: str,
+    ) -> list[Optional[LibraryItem]]:
+        """
+        Find multiple media items in a Jellyfin library.
+
+        The library is loaded once and all ID lookups are resolved in a single
+        synchronous pass over the cached indexes. Only items without a TMDb ID
+        that miss the indexes fall back to a Jellyfin search; those searches run
+        concurrently, and a failed search leaves its item unmatched.
+
+        Args:
+            items: Media items to find
+            library_id: Library ID to search in
+
+        Returns:
+            LibraryItems (or None if not found), in the same order as items
+        """
+        if not items:
+            return []
+
+        await self._ensure_library_loaded(library_id, items[0].media_type)
+
+        results = [self._find_cached(item, library_id) for item in items]
+
+        search_indexes = [
+            index
+            for index, item in enumerate(items)
+            if results[index] is None and not item.tmdb_id
+        ]
+        if not search_indexes:
+            return results
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SEARCHES)
+
+        async def _search(item: MediaItem) -> Optional[LibraryItem]:
+            async with semaphore:
+                return await self._search_by_title(item)
+
+        found = await asyncio.gather(
+            *(_search(items[index]) for index in search_indexes),
+            return_exceptions=True,
+        )
+        for index, lib_item in zip(search_indexes, found, strict=True):
+            if isinstance(lib_item, BaseException):
+                logger.warning(
+                    f"[Jellyfin] Title search failed for '{items[index].title}': {lib_item}"
+                )
+                continue
+            results[index] = lib_item
+
+        return results
+
+    def _find_cached(
+        self,
+        item: MediaItem,
+        library_id: Optional[str],
+    ) -> Optional[LibraryItem]:
+        """
+        Look up an item in the match cache and loaded library indexes.
+
+        Items with a TMDb ID that are not found are cached as missing.
+        """
+        year_str = f" ({item.year})" if item.year else ""
+        tmdb_str = f"tmdb:{item.tmdb_id}" if item.tmdb_id else "no-tmdb"
+
         # Check global cache first (for cross-library lookups)
-        if item.tmdb_id and item.tmdb_id in self._cache:
-            cached = self._cache[item.tmdb_id]
+        if item.tmdb_id:
+            cached = self._hits.get(item.tmdb_id)
             if cached:
                 logger.debug(f"[Jellyfin] Cache hit: [{tmdb_str}] {item.title}{year_str} -> {cached.title}")
-            return cached
+                return cached
+            if item.tmdb_id in self._misses:
+                return None
 
         # Try to find by TMDb ID in library cache (most reliable and fast)
-        if item.tmdb_id and library_id and library_id in self._library_items:
-            lib_item = self._library_items[library_id].get(item.tmdb_id)
+        if item.tmdb_id and library_id:
+            lib_item = self._library_items.get(library_id, _EMPTY_INDEX).get(item.tmdb_id)
             if lib_item:
-                self._cache[item.tmdb_id] = lib_item
+                self._hits[item.tmdb_id] = lib_item
                 logger.debug(
                     f"[Jellyfin] FOUND: [{tmdb_str}] {item.title}{year_str} "
                     f"-> {lib_item.title} ({lib_item.year})"
                 )
                 return lib_item
 
-        # Fall back to search by title and year (for items without TMDb ID)
-        if not item.tmdb_id:
-            logger.debug(f"[Jellyfin] Searching by title (no TMDb ID): '{item.title}'{year_str}")
-            results = await self.jellyfin.search_items(
-                query=item.title,
-                media_type=item.media_type,
-                limit=5,
-            )
-
-            # Find best match
-            for lib_item in results:
-                if self._is_match(item, lib_item):
-                    logger.debug(
-                        f"[Jellyfin] FOUND by title: {item.title}{year_str} "
-                        f"-> {lib_item.title} ({lib_item.year})"
-                    )
-                    return lib_item
-
-        # Not found
+        # Try IMDb/TVDB IDs in library cache (IMDb lists, Sonarr items, missing Tmdb provider)
+        if library_id:
+            lib_item = self._find_by_external_ids(item, library_id)
+            if lib_item:
+                if item.tmdb_id:
+                    self._hits[item.tmdb_id] = lib_item
+                logger.debug(
+                    f"[Jellyfin] FOUND by external ID: {item.title}{year_str} "
+                    f"-> {lib_item.title} ({lib_item.year})"
+                )
+                return lib_item
+
+        # Items without TMDb ID: try the title index before a Jellyfin search
+        if library_id and not item.tmdb_id and library_id in self._library_listing:
+            lib_item = self._find_by_title(item, library_id)
+            if lib_item:
+                logger.debug(
+                    f"[Jellyfin] FOUND by title index: {item.title}{year_str} "
+                    f"-> {lib_item.title} ({lib_item.year})"
+                )
+                return lib_item
+
+        # Not found (items without TMDb ID may still be found by title search)
         if item.tmdb_id:
-            self._cache[item.tmdb_id] = None
+            self._misses.add(item.tmdb_id)
+            logger.debug(f"[Jellyfin] NOT FOUND: [{tmdb_str}] {item.title}{year_str}")
 
-        logger.debug(f"[Jellyfin] NOT FOUND: [{tmdb_str}] {item.title}{year_str}")
+        return None
+
+    async def _search_by_title(self, item: MediaItem) -> Optional[LibraryItem]:
+        """Search Jellyfin by title and year for items without TMDb ID."""
+        year_str = f" ({item.year})" if item.year else ""
+
+        logger.debug(f"[Jellyfin] Searching by title (no TMDb ID): '{item.title}'{year_str}")
+        results = await self.jellyfin.search_items(
+            query=item.title,
+            media_type=item.media_type,
+            limit=5,
+        )
+
+        # Find best match
+        for lib_item in results:
+            if self._is_match(item, lib_item):
+                logger.debug(
+                    f"[Jellyfin] FOUND by title: {item.title}{year_str} "
+                    f"-> {lib_item.title} ({lib_item.year})"
+                )
+                return lib_item
+
+        logger.debug(f"[Jellyfin] NOT FOUND: [no-tmdb] {item.title}{year_str}")
+        return None
+
+    def _find_by_external_ids(self, item: MediaItem, library_id: str) -> Optional[LibraryItem]:
+        """Look up an item by IMDb or TVDB ID in the cached library indexes."""
+        if item.imdb_id:
+            lib_item = self._library_imdb.get(library_id, _EMPTY_INDEX).get(item.imdb_id)
+            if lib_item:
+                return lib_item
+        if item.tvdb_id:
+            return self._library_tvdb.get(library_id, _EMPTY_INDEX).get(item.tvdb_id)
+        return None
+
+    def _find_by_title(self, item: MediaItem, library_id: str) -> Optional[LibraryItem]:
+        """Look up an item by normalized title (and year) in the cached library listing."""
+        titles = self._library_titles.get(library_id)
+        if titles is None:
+            titles = {}
+            for lib_item in self._library_listing[library_id]:
+                titles.setdefault(self._normalize_title(lib_item.title), []).append(lib_item)
+            self._library_titles[library_id] = titles
+
+        for lib_item in titles.get(self._normalize_title(item.title), ()):
+            if self._is_match(item, lib_item):
+                return lib_item
         return None
 
     async def batch_find(
@@ -130,14 +336,18 @@ class MediaMatcher:
         Returns:
             Dictionary mapping TMDb IDs to LibraryItems (or None if not found)
         """
-        results = {}
-
-        for item in items:
-            if not item.tmdb_id:
-                continue
-
-            lib_item = await self.find_in_library(item, library_id)
-            results[item.tmdb_id] = lib_item
+        # Items with a TMDb ID never need a title search, so once the library is
+        # loaded every lookup is a synchronous cache hit
+        tmdb_items = [item for item in items if item.tmdb_id]
+        if library_id:
+            lib_items = await self.find_many(tmdb_items, library_id)
+        else:
+            lib_items = [self._find_cached(item, None) for item in tmdb_items]
+        results = {
+            item.tmdb_id: lib_item
+            for item, lib_item in zip(tmdb_items, lib_items, strict=True)
+            if item.tmdb_id
+        }
 
         found = sum(1 for v in results.values() if v is not None)
         logger.info(f"Matched {found}/{len(items)} items in library")
@@ -167,31 +377,25 @@ class MediaMatcher:
         if item.tvdb_id and lib_item.tvdb_id:
             return item.tvdb_id == lib_item.tvdb_id
 
-        # Fall back to title + year comparison
-        title_match = self._normalize_title(item.title) == self._normalize_title(lib_item.title)
-
-        if not title_match:
+        # Fall back to year + title comparison. The year check (allowing 1 year
+        # difference for release date variations) is cheaper, so it runs first.
+        if item.year and lib_item.year and abs(item.year - lib_item.year) > 1:
             return False
 
-        # If titles match, check year (allow 1 year difference for release date variations)
-        if item.year and lib_item.year:
-            return abs(item.year - lib_item.year) <= 1
-
-        # Title matches, no year to compare
-        return True
+        return self._normalize_title(item.title) == self._normalize_title(lib_item.title)
 
-    def _normalize_title(self, title: str) -> str:
-        """Normalize title for comparison."""
+    @staticmethod
+    @functools.lru_cache(maxsize=100_000)
+    def _normalize_title(title: str) -> str:
+        """Normalize title for comparison (cached; library titles repeat across lookups)."""
         # Lowercase
         title = title.lower()
 
-        # Remove common articles
-        for article in ["the ", "a ", "an ", "le ", "la ", "les ", "un ", "une "]:
-            if title.startswith(article):
-                title = title[len(article) :]
+        # Remove a leading article
+        title = ARTICLE_PATTERN.sub("", title, count=1)
 
         # Remove special characters
-        title = "".join(c for c in title if c.isalnum() or c.isspace())
+        title = SPECIAL_CHARS_PATTERN.sub("", title)
 
         # Normalize whitespace
         title = " ".join(title.split())
@@ -200,7 +404,8 @@ class MediaMatcher:
 
     def clear_cache(self) -> None:
         """Clear the match cache."""
-        self._cache.clear()
+        self._hits.clear()
+        self._misses.clear()
         logger.debug("Media matcher cache cleared")
 
     def reset(self) -> None:
@@ -210,7 +415,14 @@ class MediaMatcher:
         This should be called at the start of each scheduled run to ensure
         newly added items in Jellyfin are detected.
         """
-        self._cache.clear()
+        self._hits.clear()
+        self._misses.clear()
         self._library_loaded.clear()
+        self._library_listing.clear()
         self._library_items.clear()
+        self._library_imdb.clear()
+        self._library_tvdb.clear()
+        self._library_titles.clear()
+        # Loads never span runs (the runner settles them before resetting)
+        self._load_locks.clear()
         logger.info("[MediaMatcher] Cache reset - libraries will be reloaded")
@@ -1,15 +1,27 @@
 """Automatic poster generation using OpenAI gpt-image-1.5 and GPT-5.1."""
 
+import asyncio
 import base64
 import json
+import os
+import re
+import shutil
 import time
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Optional
 
 import httpx
 import yaml
-from jinja2 import Environment, FileSystemLoader, BaseLoader, ChoiceLoader
+from jinja2 import (
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+)
 from loguru import logger
 from openai import AsyncOpenAI
 
@@ -21,6 +33,20 @@ from jfc.models.media import MediaItem
 # CONSTANTS
 # =============================================================================
 
+# Maximum number of collection items used as poster context
+MAX_CONTEXT_ITEMS = 10
+
+# Appended signatures before the cache log is compacted into the JSON file
+SIGNATURES_LOG_COMPACT_THRESHOLD = 100
+
+# Category suffix stripped from collection names for display, e.g. "(Films)"
+CATEGORY_SUFFIX_PATTERN = re.compile(
+    r"\s*\((Films?|Séries?|Series?|Cartoons?|TV|Shows?)\)\s*$", re.IGNORECASE
+)
+
+# Characters not allowed in file names (anything but alphanumerics, "_", "-" and spaces)
+UNSAFE_FILENAME_PATTERN = re.compile(r"[^\w \-]+")
+
 MODEL_GPT_5_1 = "gpt-5.1"  # For scene descriptions and visual signatures
 MODEL_GPT_IMAGE_1_5 = "gpt-image-1.5"
 MODEL_DALL_E_3 = "dall-e-3"
@@ -36,8 +62,8 @@ API_TIMEOUT = httpx.Timeout(
 # CONSTANTS
 # =============================================================================
 
-# TMDb genre ID to name mapping
-TMDB_GENRES = {
+# TMDb genre ID to name mapping (read-only)
+TMDB_GENRES = MappingProxyType({
     28: "Action", 12: "Adventure", 16: "Animation", 35: "Comedy",
     80: "Crime", 99: "Documentary", 18: "Drama", 10751: "Family",
     14: "Fantasy", 36: "History", 27: "Horror", 10402: "Music",
@@ -46,7 +72,7 @@ TMDB_GENRES = {
     10759: "Action & Adventure", 10762: "Kids", 10763: "News",
     10764: "Reality", 10765: "Sci-Fi & Fantasy", 10766: "Soap",
     10767: "Talk", 10768: "War & Politics",
-}
+})
 
 
 # =============================================================================
@@ -60,6 +86,9 @@ class PosterGenerator:
     # Package templates directory (fallback)
     PACKAGE_TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
+    # Maximum simultaneous OpenAI requests (keeps bursts under the rate limits)
+    MAX_CONCURRENT_REQUESTS = 4
+
     def __init__(
         self,
         api_key: str,
@@ -83,6 +112,7 @@ class PosterGenerator:
             logo_text: Logo text for bottom of posters (default: NETFLEX)
         """
         self.client = AsyncOpenAI(api_key=api_key, timeout=API_TIMEOUT)
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -106,7 +136,11 @@ class PosterGenerator:
 
         # Load cached visual signatures
         self.signatures_cache_path = self.cache_dir / "visual_signatures_cache.json"
+        self.signatures_log_path = self.cache_dir / "visual_signatures_cache.jsonl"
+        self._signatures_log_count = 0
         self.signatures_cache = self._load_signatures_cache()
+        # Signature generations in progress, shared by concurrent posters
+        self._inflight: dict[str, asyncio.Future] = {}
 
         logger.info(f"PosterGenerator initialized (output: {output_dir}, logo: {logo_text})")
         if templates_dir and templates_dir.exists():
@@ -122,8 +156,21 @@ class PosterGenerator:
 
         Priority: config/templates (user) > src/jfc/templates (package)
         """
-        # Initialize Jinja2 environment with BaseLoader (we'll load manually)
-        self.jinja_env = Environment(loader=BaseLoader(), autoescape=False)
+        # Loaders in priority order; Jinja caches compiled templates in memory and
+        # the bytecode cache skips recompiling them on later runs
+        loaders = []
+        if self.templates_dir:
+            loaders.append(FileSystemLoader(self.templates_dir))
+        loaders.append(FileSystemLoader(self.package_templates_dir))
+
+        bytecode_dir = self.cache_dir / "jinja_bcc"
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+
+        self.jinja_env = Environment(
+            loader=ChoiceLoader(loaders),
+            bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir)),
+            autoescape=False,
+        )
 
         # Load YAML configurations (user override > package default)
         self.category_styles = self._load_yaml_config("category_styles.yaml")
@@ -163,52 +210,69 @@ class PosterGenerator:
         logger.warning(f"No config found for {filename}")
         return {}
 
-    def _get_template(self, name: str) -> str:
-        """Get template content from file.
+    def _get_template(self, name: str) -> Template:
+        """Get a compiled template.
 
         Priority: config/templates (user) > src/jfc/templates (package)
         """
-        # 1. Try user override (config/templates)
-        if self.templates_dir:
-            user_path = self.templates_dir / name
-            if user_path.exists():
-                try:
-                    with open(user_path, encoding="utf-8") as f:
-                        content = f.read()
-                        logger.debug(f"Loaded user template: {name}")
-                        return content
-                except Exception as e:
-                    logger.warning(f"Failed to load user template {name}: {e}")
-
-        # 2. Fall back to package default (src/jfc/templates)
-        package_path = self.package_templates_dir / name
-        if package_path.exists():
-            try:
-                with open(package_path, encoding="utf-8") as f:
-                    content = f.read()
-                    logger.debug(f"Loaded package template: {name}")
-                    return content
-            except Exception as e:
-                logger.warning(f"Failed to load package template {name}: {e}")
-
-        # 3. Raise error if template not found
-        raise FileNotFoundError(f"Template not found: {name}")
+        try:
+            return self.jinja_env.get_template(name)
+        except TemplateNotFound:
+            raise FileNotFoundError(f"Template not found: {name}") from None
 
     def _load_signatures_cache(self) -> dict[str, str]:
-        """Load cached visual signatures from JSON file."""
+        """Load cached visual signatures (compact JSON snapshot + append log)."""
+        cache: dict[str, str] = {}
         if self.signatures_cache_path.exists():
             try:
                 with open(self.signatures_cache_path, encoding="utf-8") as f:
-                    return json.load(f)
+                    cache = json.load(f)
             except Exception as e:
                 logger.warning(f"Failed to load signatures cache: {e}")
-        return {}
+
+        # Replay signatures appended since the last compaction
+        if self.signatures_log_path.exists():
+            try:
+                with open(self.signatures_log_path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            cache.update(json.loads(line))
+                            self._signatures_log_count += 1
+                        except json.JSONDecodeError:
+                            # Partially written last line (interrupted run)
+                            continue
+            except Exception as e:
+                logger.warning(f"Failed to load signatures log: {e}")
+
+        return cache
+
+    def _append_signatures(self, signatures: dict[str, str]) -> None:
+        """Persist new signatures by appending them to the cache log.
+
+        The log is compacted into the JSON snapshot once it grows past
+        SIGNATURES_LOG_COMPACT_THRESHOLD entries.
+        """
+        try:
+            with open(self.signatures_log_path, "a", encoding="utf-8") as f:
+                for title, signature in signatures.items():
+                    f.write(json.dumps({title: signature}, ensure_ascii=False) + "\n")
+            self._signatures_log_count += len(signatures)
+        except Exception as e:
+            logger.warning(f"Failed to append to signatures log: {e}")
+            return
+
+        if self._signatures_log_count >= SIGNATURES_LOG_COMPACT_THRESHOLD:
+            self._save_signatures_cache()
 
     def _save_signatures_cache(self) -> None:
-        """Save visual signatures cache to JSON file."""
+        """Atomically write the full signatures cache and clear the append log."""
+        tmp_path = self.signatures_cache_path.with_suffix(".json.tmp")
         try:
-            with open(self.signatures_cache_path, "w", encoding="utf-8") as f:
-                json.dump(self.signatures_cache, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.signatures_cache, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.signatures_cache_path)
+            self.signatures_log_path.unlink(missing_ok=True)
+            self._signatures_log_count = 0
             logger.debug(f"Saved {len(self.signatures_cache)} signatures to cache")
         except Exception as e:
             logger.warning(f"Failed to save signatures cache: {e}")
@@ -236,27 +300,44 @@ class PosterGenerator:
 
         Keeps only the N most recent files based on configured limits.
         """
-        # Cleanup poster history
-        if self.poster_history_limit > 0:
-            history_dir = col_dir / "history"
-            files = sorted(history_dir.glob("*.png"))
-            for f in files[:-self.poster_history_limit]:
-                try:
-                    f.unlink()
-                    logger.debug(f"Deleted old poster: {f.name}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete {f}: {e}")
+        self._prune_dir(col_dir / "history", ".png", self.poster_history_limit)
+        self._prune_dir(col_dir / "prompts", ".json", self.prompt_history_limit)
 
-        # Cleanup prompt history
-        if self.prompt_history_limit > 0:
-            prompts_dir = col_dir / "prompts"
-            files = sorted(prompts_dir.glob("*.json"))
-            for f in files[:-self.prompt_history_limit]:
-                try:
-                    f.unlink()
-                    logger.debug(f"Deleted old prompt: {f.name}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete {f}: {e}")
+    @staticmethod
+    def _prune_dir(directory: Path, suffix: str, limit: int) -> None:
+        """
+        Delete all but the newest files with the given suffix.
+
+        File names are timestamps, so name order is chronological and a single
+        directory listing is enough (no per-file stat).
+
+        Args:
+            directory: Directory to prune
+            suffix: File extension to consider (e.g. ".png")
+            limit: Number of files to keep (0=unlimited)
+        """
+        if limit <= 0:
+            return
+
+        try:
+            with os.scandir(directory) as it:
+                entries = [e for e in it if e.name.endswith(suffix) and e.is_file()]
+        except FileNotFoundError:
+            return
+
+        if len(entries) <= limit:
+            return
+
+        entries.sort(key=lambda e: e.name)
+        for entry in entries[:-limit]:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to delete {entry.path}: {e}")
+
+        logger.debug(f"Deleted {len(entries) - limit} old files from {directory}")
 
     async def generate_poster(
         self,
@@ -273,7 +354,8 @@ class PosterGenerator:
 
         Args:
             config: Collection configuration
-            items: Items in the collection (for context)
+            items: Items in the collection (for context, only the first
+                MAX_CONTEXT_ITEMS are used)
             category: Category type (FILMS, SÉRIES, CARTOONS)
             library: Library name for folder organization
             force_regenerate: Regenerate even if poster exists
@@ -303,22 +385,24 @@ class PosterGenerator:
             )
             logger.debug(f"Visual signatures: {visual_signatures[:100]}...")
 
+            # Theme, style and display name shared by both prompts
+            context = self._prepare_render_context(config, category)
+
             # Step 2: Generate scene description using GPT-5.1
-            scene_prompt = self._build_scene_prompt(config, category, visual_signatures)
+            scene_prompt = self._build_scene_prompt(context, category, visual_signatures)
             scene_description = await self._generate_scene_description(
                 scene_prompt, visual_signatures
             )
             logger.debug(f"Scene description: {scene_description[:200]}...")
 
             # Step 3: Build the full prompt
-            full_prompt = self._build_prompt(config, category, scene_description)
+            full_prompt = self._build_prompt(context, category, scene_description)
             logger.debug(f"Full prompt length: {len(full_prompt)} chars")
 
             # Step 4: Move existing poster to history (if exists)
             if output_path.exists():
                 history_poster = col_dir / "history" / f"{timestamp}.png"
-                import shutil
-                shutil.move(str(output_path), str(history_poster))
+                await asyncio.to_thread(shutil.move, str(output_path), str(history_poster))
                 logger.debug(f"Moved old poster to history: {timestamp}.png")
 
             # Step 5: Generate image
@@ -328,7 +412,9 @@ class PosterGenerator:
 
             if image_path:
                 # Step 6: Save prompt to collection's prompts folder
-                self._save_prompt_to_collection(
+                # (file I/O runs in a worker thread to keep the event loop free)
+                await asyncio.to_thread(
+                    self._save_prompt_to_collection,
                     col_dir=col_dir,
                     timestamp=timestamp,
                     config=config,
@@ -342,7 +428,7 @@ class PosterGenerator:
                 )
 
                 # Step 7: Apply retention limits
-                self._cleanup_history(col_dir)
+                await asyncio.to_thread(self._cleanup_history, col_dir)
 
                 logger.success(
                     f"Generated poster: {library}/{config.name}/poster.png ({elapsed:.1f}s)"
@@ -354,19 +440,36 @@ class PosterGenerator:
 
         return None
 
+    def _prepare_render_context(self, config: CollectionConfig, category: str) -> dict[str, Any]:
+        """
+        Resolve the theme, category style and display name for a collection.
+
+        Computed once per poster and shared by the scene and image prompts.
+
+        Args:
+            config: Collection configuration
+            category: Category type (FILMS, SÉRIES, CARTOONS)
+
+        Returns:
+            Dict with "theme", "style" and "display_name" keys
+        """
+        return {
+            "theme": self._get_collection_theme(config.name),
+            "style": self.category_styles.get(category, self.category_styles.get("FILMS", {})),
+            # Clean collection name for display (remove "(Films)", emojis, etc.)
+            "display_name": self._clean_display_name(config.name),
+        }
+
     def _build_scene_prompt(
         self,
-        config: CollectionConfig,
+        context: dict[str, Any],
         category: str,
         visual_signatures: str,
     ) -> str:
         """Build the scene description prompt with visual signatures."""
-        # Get theme hints
-        theme = self._get_collection_theme(config.name)
-        style = self.category_styles.get(category, self.category_styles.get("FILMS", {}))
-
-        # Clean collection name for display (remove "(Films)", emojis, etc.)
-        display_name = self._clean_display_name(config.name)
+        theme = context["theme"]
+        style = context["style"]
+        display_name = context["display_name"]
 
         # Override mood and colors for CARTOONS
         if category == "CARTOONS":
@@ -386,8 +489,7 @@ IMPORTANT FOR CARTOONS:
             extra_rules = ""
 
         # Get template (user override > package default)
-        template_content = self._get_template("scene_description.j2")
-        template = self.jinja_env.from_string(template_content)
+        template = self._get_template("scene_description.j2")
         base_prompt = template.render(
             collection_name=display_name,
             category=category,
@@ -419,7 +521,8 @@ IMPORTANT FOR CARTOONS:
         # Collect signatures with their source titles
         # Use top 8 items: 3 primary + 5 secondary references
         signature_data: list[tuple[str, str]] = []  # (title, signature)
-        items_needing_generation = []
+        items_needing_generation: list[MediaItem] = []
+        awaited: dict[str, asyncio.Future] = {}  # Titles another poster is generating
 
         for item in items[:8]:
             signature = None
@@ -432,17 +535,34 @@ IMPORTANT FOR CARTOONS:
 
             if signature:
                 signature_data.append((item.title, signature))
-            else:
+            elif item.title in self._inflight:
+                # Already being generated by a concurrent poster: share its result
+                awaited[item.title] = self._inflight[item.title]
+            elif all(item.title != other.title for other in items_needing_generation):
                 # Need to generate from metadata
                 items_needing_generation.append(item)
 
         # 3. Generate missing signatures from metadata
         if items_needing_generation:
-            new_signatures = await self._generate_signatures_from_metadata(
-                items_needing_generation
-            )
-            for item, sig in zip(items_needing_generation, new_signatures):
-                signature_data.append((item.title, sig))
+            loop = asyncio.get_running_loop()
+            for item in items_needing_generation:
+                self._inflight[item.title] = loop.create_future()
+            try:
+                await self._generate_signatures_from_metadata(items_needing_generation)
+            finally:
+                # Resolve waiters even on failure (None = no signature)
+                for item in items_needing_generation:
+                    self._inflight.pop(item.title).set_result(
+                        self.signatures_cache.get(item.title)
+                    )
+            for item in items_needing_generation:
+                if item.title in self.signatures_cache:
+                    signature_data.append((item.title, self.signatures_cache[item.title]))
+
+        for title, future in awaited.items():
+            sig = await future
+            if sig:
+                signature_data.append((title, sig))
 
         if signature_data:
             logger.debug(f"Total {len(signature_data)} visual signatures")
@@ -491,9 +611,9 @@ IMPORTANT FOR CARTOONS:
 
         Uses genres and overview (not title) to avoid copyright issues.
         """
-        signatures = []
+        template = self._get_template("visual_signature.j2")
 
-        for item in items:
+        async def _one(item: MediaItem) -> Optional[str]:
             # Build metadata context (no title!)
             # Convert genre IDs to names if needed
             genre_names = []
@@ -509,13 +629,10 @@ IMPORTANT FOR CARTOONS:
             if len(overview) > 200:
                 overview = overview[:200] + "..."
 
-            # Get template (user override > package default)
-            template_content = self._get_template("visual_signature.j2")
-            template = self.jinja_env.from_string(template_content)
             prompt = template.render(genres=genres, overview=overview)
 
-            try:
-                logger.debug(f"[GPT] Generating signature for '{item.title}' from metadata...")
+            logger.debug(f"[GPT] Generating signature for '{item.title}' from metadata...")
+            async with self._semaphore:
                 response = await self.client.chat.completions.create(
                     model=MODEL_GPT_5_1,
                     messages=[{"role": "user", "content": prompt}],
@@ -523,20 +640,27 @@ IMPORTANT FOR CARTOONS:
                     reasoning_effort="low",
                 )
 
-                content = response.choices[0].message.content
-                if content:
-                    signature = content.strip()
-                    signatures.append(signature)
-                    # Cache for future use
-                    self.signatures_cache[item.title] = signature
-                    logger.debug(f"[GPT] Generated and cached: '{signature[:50]}...'")
+            content = response.choices[0].message.content
+            return content.strip() if content else None
 
-            except Exception as e:
-                logger.warning(f"Failed to generate signature for '{item.title}': {e}")
+        # Generate all signatures concurrently; results keep the input order
+        results = await asyncio.gather(*(_one(item) for item in items), return_exceptions=True)
 
-        # Save cache after generating new signatures
-        if signatures:
-            self._save_signatures_cache()
+        signatures: list[str] = []
+        generated: dict[str, str] = {}
+        for item, result in zip(items, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to generate signature for '{item.title}': {result}")
+                continue
+            if result:
+                signatures.append(result)
+                generated[item.title] = result
+                logger.debug(f"[GPT] Generated and cached: '{result[:50]}...'")
+
+        # Cache for future use
+        if generated:
+            self.signatures_cache.update(generated)
+            self._append_signatures(generated)
 
         return signatures
 
@@ -550,12 +674,13 @@ IMPORTANT FOR CARTOONS:
         start_time = time.perf_counter()
 
         # CRITICAL: reasoning_effort MUST be "low" - "medium" causes GPT-5.1 to return empty content
-        response = await self.client.chat.completions.create(
-            model=MODEL_GPT_5_1,
-            messages=[{"role": "user", "content": prompt}],
-            max_completion_tokens=500,
-            reasoning_effort="low",
-        )
+        async with self._semaphore:
+            response = await self.client.chat.completions.create(
+                model=MODEL_GPT_5_1,
+                messages=[{"role": "user", "content": prompt}],
+                max_completion_tokens=500,
+                reasoning_effort="low",
+            )
 
         elapsed = time.perf_counter() - start_time
         logger.debug(f"GPT-5.1 response in {elapsed:.1f}s")
@@ -613,7 +738,7 @@ IMPORTANT FOR CARTOONS:
             "category": category,
             "items_context": [
                 {"title": item.title, "year": item.year}
-                for item in items[:10]
+                for item in items[:MAX_CONTEXT_ITEMS]
             ],
             "prompts": {
                 "visual_signatures": visual_signatures,
@@ -636,16 +761,14 @@ IMPORTANT FOR CARTOONS:
 
     def _build_prompt(
         self,
-        config: CollectionConfig,
+        context: dict[str, Any],
         category: str,
         scene_description: str,
     ) -> str:
         """Build the full image generation prompt using Jinja2 template."""
-        style = self.category_styles.get(category, self.category_styles.get("FILMS", {}))
-        theme = self._get_collection_theme(config.name)
-
-        # Clean collection name for display (remove "(Films)", emojis, etc.)
-        display_name = self._clean_display_name(config.name)
+        theme = context["theme"]
+        style = context["style"]
+        display_name = context["display_name"]
 
         # Use color override for specific categories (e.g., CARTOONS)
         color_palette = style.get("color_override", theme.get("color_hint", "cinematic blues + warm highlights"))
@@ -656,8 +779,7 @@ IMPORTANT FOR CARTOONS:
             scene_prefix = "Bright, colorful, family-friendly animated scene"
 
         # Get template (user override > package default)
-        template_content = self._get_template("base_structure.j2")
-        template = self.jinja_env.from_string(template_content)
+        template = self._get_template("base_structure.j2")
         return template.render(
             poster_style=style.get("poster_style", "Cinematic"),
             category=category,
@@ -688,28 +810,29 @@ IMPORTANT FOR CARTOONS:
         start_time = time.perf_counter()
 
         try:
-            if use_dalle3:
-                # DALL-E 3 parameters (different API)
-                response = await self.client.images.generate(
-                    model=MODEL_DALL_E_3,
-                    prompt=prompt,
-                    n=1,
-                    size="1024x1792",  # Vertical format for DALL-E 3
-                    quality="hd",  # HD quality
-                    style="vivid",  # More vivid/dramatic style
-                    response_format="b64_json",
-                )
-            else:
-                # gpt-image-1.5 parameters
-                response = await self.client.images.generate(
-                    model=MODEL_GPT_IMAGE_1_5,
-                    prompt=prompt,
-                    n=1,
-                    size="1024x1536",  # Vertical 2:3 ratio for posters
-                    quality="high",  # Maximum detail for photorealism
-                    output_format="png",  # Lossless quality
-                    background="opaque",  # Solid background for poster
-                )
+            async with self._semaphore:
+                if use_dalle3:
+                    # DALL-E 3 parameters (different API)
+                    response = await self.client.images.generate(
+                        model=MODEL_DALL_E_3,
+                        prompt=prompt,
+                        n=1,
+                        size="1024x1792",  # Vertical format for DALL-E 3
+                        quality="hd",  # HD quality
+                        style="vivid",  # More vivid/dramatic style
+                        response_format="b64_json",
+                    )
+                else:
+                    # gpt-image-1.5 parameters
+                    response = await self.client.images.generate(
+                        model=MODEL_GPT_IMAGE_1_5,
+                        prompt=prompt,
+                        n=1,
+                        size="1024x1536",  # Vertical 2:3 ratio for posters
+                        quality="high",  # Maximum detail for photorealism
+                        output_format="png",  # Lossless quality
+                        background="opaque",  # Solid background for poster
+                    )
 
             elapsed = time.perf_counter() - start_time
             logger.debug(f"{model} response in {elapsed:.1f}s")
@@ -718,8 +841,7 @@ IMPORTANT FOR CARTOONS:
             image_data = response.data[0].b64_json
             image_bytes = base64.b64decode(image_data)
 
-            with open(output_path, "wb") as f:
-                f.write(image_bytes)
+            await asyncio.to_thread(output_path.write_bytes, image_bytes)
 
             return output_path
 
@@ -745,7 +867,7 @@ IMPORTANT FOR CARTOONS:
     def _safe_filename(self, name: str) -> str:
         """Convert collection name to safe filename."""
         # Remove emojis and special chars
-        safe = "".join(c for c in name if c.isalnum() or c in " _-")
+        safe = UNSAFE_FILENAME_PATTERN.sub("", name)
         return safe.strip().replace(" ", "_").lower()
 
     def _clean_display_name(self, name: str) -> str:
@@ -760,11 +882,8 @@ IMPORTANT FOR CARTOONS:
 
         Example: "🔥 Tendances (Films)" -> "🔥 Tendances"
         """
-        import re
-
         # Remove category suffixes (case insensitive, with or without accents)
-        suffixes_pattern = r'\s*\((Films?|Séries?|Series?|Cartoons?|TV|Shows?)\)\s*$'
-        cleaned = re.sub(suffixes_pattern, '', name, flags=re.IGNORECASE)
+        cleaned = CATEGORY_SUFFIX_PATTERN.sub("", name)
 
         # Clean up whitespace
         cleaned = cleaned.strip()
@@ -1,6 +1,7 @@
 """Main runner service that orchestrates collection updates."""
 
 import asyncio
+import contextlib
 import time
 import uuid
 from datetime import datetime
@@ -22,7 +23,7 @@ from jfc.clients.telegram import NotificationContext, TelegramClient, TrendingIt
 from jfc.clients.tmdb import TMDbClient
 from jfc.clients.trakt import TraktClient
 from jfc.core.config import Settings
-from jfc.models.collection import CollectionSchedule, ScheduleType
+from jfc.models.collection import CollectionConfig, CollectionSchedule, ScheduleType
 from jfc.models.media import MediaType
 from jfc.models.report import CollectionReport, LibraryReport, RunReport
 from jfc.parsers.kometa import KometaParser
@@ -208,7 +209,9 @@ class Runner:
             else:
                 logger.warning("Trakt not authenticated. Run 'jfc trakt-auth' to authenticate.")
 
-        # Run startup sequence (only once)
+        # Run startup sequence (only once). The startup preload fills the matcher
+        # cache for this first run; later runs reset caches to detect changes
+        # made in Jellyfin since.
         if not self._startup_done:
             startup_ok = await self.startup.run_startup(matcher=self.builder.matcher)
             self._startup_done = True
@@ -216,9 +219,8 @@ class Runner:
             if not startup_ok:
                 logger.error("Startup failed - aborting run")
                 raise RuntimeError("Startup failed: required services not available")
-
-        # Reset media matcher cache to detect newly added items in Jellyfin
-        self.builder.matcher.reset()
+        else:
+            self.builder.reset()
 
         # Initialize run report
         run_report = RunReport(
@@ -252,6 +254,174 @@ class Runner:
         jellyfin_libraries = await self.jellyfin.get_libraries()
         library_id_map = {lib["Name"]: lib["ItemId"] for lib in jellyfin_libraries}
 
+        # Load the libraries this run needs in the background; each build waits
+        # only for its own library while the others keep loading
+        warm_task = asyncio.create_task(
+            self.builder.matcher.warm({
+                library_id_map[name]: self._infer_media_type(name)
+                for name in library_names
+                if name in library_id_map
+            })
+        )
+
+        try:
+            await self._process_libraries(
+                all_collections,
+                library_id_map,
+                run_report,
+                trending_items,
+                collections=collections,
+                scheduled=scheduled,
+                ignore_schedule=ignore_schedule,
+                force_posters=force_posters,
+                posters_only=posters_only,
+            )
+        except BaseException:
+            # Don't leave library loads running into the next run's reset()
+            warm_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await warm_task
+            raise
+
+        await warm_task
+
+        # Finalize report
+        run_report.finalize()
+
+        # Send run end notification
+        await self.discord.send_run_end(
+            duration_seconds=run_report.duration_seconds,
+            collections_updated=run_report.successful_collections,
+            items_added=run_report.total_items_added,
+            items_removed=run_report.total_items_removed,
+            errors=run_report.failed_collections,
+            radarr_requests=run_report.total_radarr_requests,
+            sonarr_requests=run_report.total_sonarr_requests,
+        )
+
+        # Process Telegram notifications by trigger
+        if self.telegram:
+            # Build context for notifications
+            context = NotificationContext(
+                trigger="trending",
+                films=trending_items["films"],
+                series=trending_items["series"],
+                duration_seconds=run_report.duration_seconds,
+                collections_updated=run_report.successful_collections,
+                items_added=run_report.total_items_added,
+                items_removed=run_report.total_items_removed,
+            )
+
+            # Process "trending" trigger notifications
+            for notification in self.settings.telegram.get_notifications_by_trigger("trending"):
+                try:
+                    await self.telegram.process_notification(notification, context)
+                except Exception as e:
+                    logger.warning(f"Telegram notification '{notification.name}' failed: {e}")
+
+            # Process "run_end" trigger notifications
+            context.trigger = "run_end"
+            for notification in self.settings.telegram.get_notifications_by_trigger("run_end"):
+                try:
+                    await self.telegram.process_notification(notification, context)
+                except Exception as e:
+                    logger.warning(f"Telegram notification '{notification.name}' failed: {e}")
+
+        # Process Signal notifications by trigger
+        if self.signal:
+            # Build context for Signal notifications (using Signal's dataclasses)
+            signal_films = [
+                SignalTrendingItem(
+                    title=f.title,
+                    year=f.year,
+                    genres=f.genres,
+                    poster_url=f.poster_url,
+                    tmdb_id=f.tmdb_id,
+                    available=f.available,
+                )
+                for f in trending_items["films"]
+            ]
+            signal_series = [
+                SignalTrendingItem(
+                    title=s.title,
+                    year=s.year,
+                    genres=s.genres,
+                    poster_url=s.poster_url,
+                    tmdb_id=s.tmdb_id,
+                    available=s.available,
+                )
+                for s in trending_items["series"]
+            ]
+
+            signal_context = SignalNotificationContext(
+                trigger="trending",
+                films=signal_films,
+                series=signal_series,
+                duration_seconds=run_report.duration_seconds,
+                collections_updated=run_report.successful_collections,
+                items_added=run_report.total_items_added,
+                items_removed=run_report.total_items_removed,
+            )
+
+            # Process "trending" trigger notifications
+            for notification in self.settings.signal.get_notifications_by_trigger("trending"):
+                try:
+                    await self.signal.process_notification(notification, signal_context)
+                except Exception as e:
+                    logger.warning(f"Signal notification '{notification.name}' failed: {e}")
+
+            # Process "run_end" trigger notifications
+            signal_context.trigger = "run_end"
+            for notification in self.settings.signal.get_notifications_by_trigger("run_end"):
+                try:
+                    await self.signal.process_notification(notification, signal_context)
+                except Exception as e:
+                    logger.warning(f"Signal notification '{notification.name}' failed: {e}")
+
+        # Print and save report
+        self.report_generator.print_run_report(run_report)
+
+        try:
+            self.report_generator.save_report(run_report)
+        except Exception as e:
+            logger.warning(f"Failed to save report: {e}")
+
+        logger.info(
+            f"Run completed in {run_report.duration_seconds:.1f}s: "
+            f"{run_report.successful_collections} collections, "
+            f"+{run_report.total_items_added} -{run_report.total_items_removed} items, "
+            f"{run_report.failed_collections} errors"
+        )
+
+        return run_report
+
+    async def _process_libraries(
+        self,
+        all_collections: dict[str, list[CollectionConfig]],
+        library_id_map: dict[str, str],
+        run_report: RunReport,
+        trending_items: dict[str, list[TrendingItem]],
+        *,
+        collections: Optional[list[str]],
+        scheduled: bool,
+        ignore_schedule: bool,
+        force_posters: bool,
+        posters_only: bool,
+    ) -> None:
+        """
+        Build and sync the collections of each library into the run report.
+
+        Args:
+            all_collections: Collection configs by library name
+            library_id_map: Jellyfin library IDs by library name
+            run_report: Run report to append library reports to
+            trending_items: Trending items to collect for notifications
+            collections: Optional list of collection names to process
+            scheduled: Whether this is a scheduled run
+            ignore_schedule: Ignore individual collection schedules
+            force_posters: Force regeneration of all posters
+            posters_only: Only generate posters, skip collection sync
+        """
         # Process each library
         for library_name, collection_configs in all_collections.items():
             logger.info(f"Processing library: {library_name}")
@@ -387,116 +557,6 @@ class Runner:
 
             run_report.libraries.append(library_report)
 
-        # Finalize report
-        run_report.finalize()
-
-        # Send run end notification
-        await self.discord.send_run_end(
-            duration_seconds=run_report.duration_seconds,
-            collections_updated=run_report.successful_collections,
-            items_added=run_report.total_items_added,
-            items_removed=run_report.total_items_removed,
-            errors=run_report.failed_collections,
-            radarr_requests=run_report.total_radarr_requests,
-            sonarr_requests=run_report.total_sonarr_requests,
-        )
-
-        # Process Telegram notifications by trigger
-        if self.telegram:
-            # Build context for notifications
-            context = NotificationContext(
-                trigger="trending",
-                films=trending_items["films"],
-                series=trending_items["series"],
-                duration_seconds=run_report.duration_seconds,
-                collections_updated=run_report.successful_collections,
-                items_added=run_report.total_items_added,
-                items_removed=run_report.total_items_removed,
-            )
-
-            # Process "trending" trigger notifications
-            for notification in self.settings.telegram.get_notifications_by_trigger("trending"):
-                try:
-                    await self.telegram.process_notification(notification, context)
-                except Exception as e:
-                    logger.warning(f"Telegram notification '{notification.name}' failed: {e}")
-
-            # Process "run_end" trigger notifications
-            context.trigger = "run_end"
-            for notification in self.settings.telegram.get_notifications_by_trigger("run_end"):
-                try:
-                    await self.telegram.process_notification(notification, context)
-                except Exception as e:
-                    logger.warning(f"Telegram notification '{notification.name}' failed: {e}")
-
-        # Process Signal notifications by trigger
-        if self.signal:
-            # Build context for Signal notifications (using Signal's dataclasses)
-            signal_films = [
-                SignalTrendingItem(
-                    title=f.title,
-                    year=f.year,
-                    genres=f.genres,
-                    poster_url=f.poster_url,
-                    tmdb_id=f.tmdb_id,
-                    available=f.available,
-                )
-                for f in trending_items["films"]
-            ]
-            signal_series = [
-                SignalTrendingItem(
-                    title=s.title,
-                    year=s.year,
-                    genres=s.genres,
-                    poster_url=s.poster_url,
-                    tmdb_id=s.tmdb_id,
-                    available=s.available,
-                )
-                for s in trending_items["series"]
-            ]
-
-            signal_context = SignalNotificationContext(
-                trigger="trending",
-                films=signal_films,
-                series=signal_series,
-                duration_seconds=run_report.duration_seconds,
-                collections_updated=run_report.successful_collections,
-                items_added=run_report.total_items_added,
-                items_removed=run_report.total_items_removed,
-            )
-
-            # Process "trending" trigger notifications
-            for notification in self.settings.signal.get_notifications_by_trigger("trending"):
-                try:
-                    await self.signal.process_notification(notification, signal_context)
-                except Exception as e:
-                    logger.warning(f"Signal notification '{notification.name}' failed: {e}")
-
-            # Process "run_end" trigger notifications
-            signal_context.trigger = "run_end"
-            for notification in self.settings.signal.get_notifications_by_trigger("run_end"):
-                try:
-                    await self.signal.process_notification(notification, signal_context)
-                except Exception as e:
-                    logger.warning(f"Signal notification '{notification.name}' failed: {e}")
-
-        # Print and save report
-        self.report_generator.print_run_report(run_report)
-
-        try:
-            self.report_generator.save_report(run_report)
-        except Exception as e:
-            logger.warning(f"Failed to save report: {e}")
-
-        logger.info(
-            f"Run completed in {run_report.duration_seconds:.1f}s: "
-            f"{run_report.successful_collections} collections, "
-            f"+{run_report.total_items_added} -{run_report.total_items_removed} items, "
-            f"{run_report.failed_collections} errors"
-        )
-
-        return run_report
-
     async def close(self) -> None:
         """Close all client connections."""
         await self.jellyfin.close()
@@ -5,6 +5,7 @@ from typing import Optional
 import httpx
 from loguru import logger
 
+from jfc.clients.base import BaseClient
 from jfc.clients.jellyfin import JellyfinClient
 from jfc.clients.radarr import RadarrClient
 from jfc.clients.sonarr import SonarrClient
@@ -62,6 +63,12 @@ class StartupService:
         Returns:
             Dictionary of service name -> connection status
         """
+        # Fail fast: retries with backoff would stall startup on a down service
+        with BaseClient.no_retries():
+            return await self._check_connections()
+
+    async def _check_connections(self) -> dict[str, bool]:
+        """Run the connection checks (see check_connections)."""
         results = {}
 
         logger.info("Checking API connections...")
@@ -0,0 +1,120 @@
+"""Unit tests for the base HTTP client retry policy."""
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from jfc.clients.base import BaseClient
+
+
+def _client_with(handler, monkeypatch) -> tuple[BaseClient, AsyncMock]:
+    """Create a base client backed by a mock transport, with sleeps stubbed out."""
+    client = BaseClient(base_url="https://example.test")
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, transport=httpx.MockTransport(handler)
+    )
+    sleep = AsyncMock()
+    monkeypatch.setattr("jfc.clients.base.asyncio.sleep", sleep)
+    return client, sleep
+
+
+@pytest.mark.asyncio
+async def test_retries_rate_limit_honoring_retry_after(monkeypatch) -> None:
+    """429 responses should be retried after the server-provided delay."""
+    statuses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), headers={"Retry-After": "3"})
+
+    client, sleep = _client_with(handler, monkeypatch)
+
+    response = await client.get("/items")
+
+    assert response.status_code == 200
+    sleep.assert_awaited_once_with(3.0)
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(monkeypatch) -> None:
+    """Persistent server errors should be returned after the retry budget."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    client, sleep = _client_with(handler, monkeypatch)
+
+    response = await client.get("/items")
+
+    assert response.status_code == 503
+    assert len(calls) == BaseClient.MAX_RETRIES + 1
+    assert sleep.await_count == BaseClient.MAX_RETRIES
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_server_errors_on_post(monkeypatch) -> None:
+    """Non-idempotent requests should not be resent after a server error."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500)
+
+    client, sleep = _client_with(handler, monkeypatch)
+
+    response = await client.post("/items", json={"title": "Dune"})
+
+    assert response.status_code == 500
+    assert len(calls) == 1
+    sleep.assert_not_awaited()
+
+
+def test_retry_delay_backs_off_and_caps() -> None:
+    """Backoff should grow exponentially with jitter and respect the cap."""
+    client = BaseClient(base_url="https://example.test")
+
+    assert 1.0 <= client._retry_delay(0) <= 2.0
+    assert 4.0 <= client._retry_delay(2) <= 5.0
+    assert client._retry_delay(10) == BaseClient.RETRY_MAX_DELAY
+    assert client._retry_delay(0, "120") == BaseClient.RETRY_MAX_DELAY
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_skips_retries(monkeypatch) -> None:
+    """retries=0 and no_retries() should surface transport errors immediately."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("connection refused")
+
+    client, sleep = _client_with(handler, monkeypatch)
+
+    with pytest.raises(httpx.ConnectError):
+        await client.get("/status", retries=0)
+    with BaseClient.no_retries(), pytest.raises(httpx.ConnectError):
+        await client.get("/status")
+
+    assert len(calls) == 2
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_total_retry_delay_is_capped(monkeypatch) -> None:
+    """Retries should stop once the next wait would exceed the total budget."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "20"})
+
+    client, sleep = _client_with(handler, monkeypatch)
+    monkeypatch.setattr(BaseClient, "RETRY_MAX_TOTAL_DELAY", 10.0)
+
+    response = await client.get("/items")
+
+    assert response.status_code == 429
+    assert len(calls) == 1
+    sleep.assert_not_awaited()
@@ -1,12 +1,21 @@
 """Unit tests for collection builder filtering and list helpers."""
 
+from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from jfc.models.collection import CollectionConfig, CollectionFilter
-from jfc.models.media import MediaType, Movie, Series
-from jfc.services.collection_builder import CollectionBuilder
+from jfc.models.collection import (
+    Collection,
+    CollectionConfig,
+    CollectionFilter,
+    CollectionItem,
+    CollectionOrder,
+    SyncMode,
+)
+from jfc.models.media import LibraryItem, MediaType, Movie, Series
+from jfc.models.report import CollectionReport
+from jfc.services.collection_builder import CollectionBuilder, _iter_unique
 
 
 @pytest.fixture
@@ -33,6 +42,13 @@ def test_apply_filters_excludes_genre_names(builder: CollectionBuilder) -> None:
     assert [item.title for item in filtered] == ["Adventure Time"]
 
 
+def test_normalize_genre_tokens_mixes_ids_and_names(builder: CollectionBuilder) -> None:
+    """Genre IDs, numeric strings and names should normalize to comparable tokens."""
+    tokens = builder._normalize_genre_tokens([18, "28", " Science_Fiction ", "", "  "])
+
+    assert tokens == {18, 28, "science fiction"}
+
+
 def test_apply_filters_matches_hyphenated_genres(builder: CollectionBuilder) -> None:
     """Genre matching should normalize hyphens and case."""
     items = [Movie(title="Future World", genres=["science-fiction"])]
@@ -46,6 +62,62 @@ def test_apply_filters_matches_hyphenated_genres(builder: CollectionBuilder) ->
     assert [item.title for item in filtered] == ["Future World"]
 
 
+def test_apply_filters_excludes_countries_and_languages(builder: CollectionBuilder) -> None:
+    """Country and language exclusions should drop matching items only."""
+    items = [
+        Movie(title="Anime", original_language="ja", original_country="JP"),
+        Movie(title="Bollywood", original_language="hi", original_country="IN"),
+        Movie(title="Western", original_language="en", original_country="US"),
+    ]
+    config = CollectionConfig(
+        name="Filtered",
+        filters=CollectionFilter(original_language_not=["ja"], origin_country_not=["IN"]),
+    )
+
+    filtered = builder._apply_filters(items, config)
+
+    assert [item.title for item in filtered] == ["Western"]
+
+
+def test_apply_filters_uses_highest_rating_threshold(builder: CollectionBuilder) -> None:
+    """Vote-average and critic thresholds should both apply to vote_average."""
+    items = [
+        Movie(title="Good", vote_average=7.2),
+        Movie(title="Great", vote_average=8.1),
+        Movie(title="Unrated"),
+    ]
+    config = CollectionConfig(
+        name="Top Rated",
+        filters=CollectionFilter(vote_average_gte=6.0, critic_rating_gte=8.0),
+    )
+
+    filtered = builder._apply_filters(items, config)
+
+    assert [item.title for item in filtered] == ["Great", "Unrated"]
+
+
+def test_apply_filters_without_filters_only_applies_limit(builder: CollectionBuilder) -> None:
+    """With no active filters, items should pass through up to the limit."""
+    items = [Movie(title=f"Movie {i}") for i in range(5)]
+
+    filtered = builder._apply_filters(items, CollectionConfig(name="All", limit=3))
+
+    assert [item.title for item in filtered] == ["Movie 0", "Movie 1", "Movie 2"]
+    assert filtered is not items
+
+
+def test_apply_filters_stops_at_limit(builder: CollectionBuilder) -> None:
+    """Filtering should stop once enough items pass."""
+    items = [Movie(title=f"Movie {i}", year=2000 + i) for i in range(10)]
+    config = CollectionConfig(
+        name="Recent", limit=2, filters=CollectionFilter(year_gte=2003)
+    )
+
+    filtered = builder._apply_filters(items, config)
+
+    assert [item.title for item in filtered] == ["Movie 3", "Movie 4"]
+
+
 @pytest.mark.asyncio
 async def test_fetch_trakt_list_uses_user_and_slug() -> None:
     """Trakt list references should fetch items via the Trakt client."""
@@ -72,3 +144,668 @@ def test_parse_trakt_list_ref_supports_url(builder: CollectionBuilder) -> None:
     parsed = builder._parse_trakt_list_ref("https://trakt.tv/users/alice/lists/favorites")
 
     assert parsed == ("alice", "favorites")
+
+
+@pytest.mark.asyncio
+async def test_fetch_imdb_list_keeps_configured_list_order() -> None:
+    """Concurrent IMDb list fetches should keep the configured list order."""
+    jellyfin = MagicMock()
+    tmdb = MagicMock()
+    tmdb.find_by_imdb_id = AsyncMock(
+        side_effect=lambda imdb_id, media_type: Movie(title=imdb_id, imdb_id=imdb_id)
+    )
+    imdb = MagicMock()
+    imdb.get_list = AsyncMock(
+        side_effect=lambda list_id, limit: {"ls1": ["tt0000001"], "ls2": ["tt0000002"]}[list_id]
+    )
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=tmdb, imdb=imdb, dry_run=True)
+
+    items = await builder._fetch_imdb_list({"list_ids": ["ls1", "ls2"]}, MediaType.MOVIE)
+
+    assert [item.imdb_id for item in items] == ["tt0000001", "tt0000002"]
+
+
+@pytest.mark.asyncio
+async def test_collections_by_name_fetched_once_per_run(builder: CollectionBuilder) -> None:
+    """Jellyfin collections should be indexed once and refreshed after reset."""
+    builder.jellyfin.get_collections = AsyncMock(
+        return_value=[
+            {"Id": "a", "Name": "Trending", "ChildCount": 3},
+            {"Id": "b", "Name": "Trending", "ChildCount": 7},
+            {"Id": "c", "Name": "Popular", "ChildCount": 1},
+        ]
+    )
+
+    first = await builder._get_collections_by_name()
+    second = await builder._get_collections_by_name()
+
+    assert [c["Id"] for c in first["Trending"]] == ["a", "b"]
+    assert second is first
+    builder.jellyfin.get_collections.assert_awaited_once()
+
+    builder.reset()
+    await builder._get_collections_by_name()
+    assert builder.jellyfin.get_collections.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_radarr_taglist_filters_by_tag_label() -> None:
+    """Radarr taglists should keep tagged movies, fetching the catalog once per run."""
+    radarr = MagicMock()
+    radarr.get_tags = AsyncMock(
+        return_value=[{"id": 1, "label": "Kids"}, {"id": 2, "label": "4k"}]
+    )
+    radarr.get_movies = AsyncMock(
+        return_value=[
+            {"title": "Cartoon", "tmdbId": 1, "tags": [1]},
+            {"title": "Blockbuster", "tmdbId": 2, "tags": [2]},
+            {"title": "Untagged", "tmdbId": 3, "tags": []},
+        ]
+    )
+    builder = CollectionBuilder(
+        jellyfin=MagicMock(), tmdb=MagicMock(), radarr=radarr, dry_run=True
+    )
+
+    items = await builder._fetch_radarr_taglist({"tags": ["kids"]})
+    hd_items = await builder._fetch_radarr_taglist({"tags": ["4K"]})
+
+    assert [item.title for item in items] == ["Cartoon"]
+    assert [item.title for item in hd_items] == ["Blockbuster"]
+    radarr.get_tags.assert_awaited_once()
+    radarr.get_movies.assert_awaited_once()
+
+    builder.reset()
+    await builder._fetch_radarr_taglist({"tags": ["kids"]})
+    assert radarr.get_movies.await_count == 2
+
+
+def test_iter_unique_prefers_ids_and_keeps_first() -> None:
+    """Provider items should dedupe on the best available ID, keeping first seen."""
+    items = [
+        Movie(title="Dune", year=2021, tmdb_id=438631),
+        Movie(title="Dune (dup)", year=2021, tmdb_id=438631),
+        Movie(title="Heat", imdb_id="tt0113277"),
+        Movie(title="Heat (dup)", imdb_id="tt0113277"),
+        Movie(title="Local Only", year=2020),
+        Movie(title="local only", year=2020),
+        Movie(title="Local Only", year=2021),
+    ]
+
+    unique = list(_iter_unique(items))
+
+    assert [item.title for item in unique] == ["Dune", "Heat", "Local Only", "Local Only"]
+
+
+def test_get_source_provider_labels_in_order(builder: CollectionBuilder) -> None:
+    """Source labels should follow table order without duplicates."""
+    config = CollectionConfig(
+        name="Mixed",
+        tmdb_trending_weekly=20,
+        tmdb_trending_daily=20,
+        trakt_chart={"chart": "watched"},
+        imdb_list={"list_ids": ["ls000000001"]},
+    )
+
+    assert builder._get_source_provider(config) == "TMDb Trending, Trakt Watched, IMDb List"
+    assert builder._get_source_provider(CollectionConfig(name="Empty")) == "Unknown"
+
+
+@pytest.mark.asyncio
+async def test_sync_collection_adds_items_and_uploads_poster() -> None:
+    """Append syncs should add new items, update metadata and upload the poster."""
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(return_value=[{"Id": "col", "Name": "Picks"}])
+    jellyfin.get_collection_items = AsyncMock(return_value=["a"])
+    jellyfin.add_to_collection = AsyncMock(return_value=True)
+    jellyfin.remove_from_collection = AsyncMock(return_value=True)
+    jellyfin.update_collection_metadata = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder._upload_poster = AsyncMock(return_value=(True, None))
+    collection = Collection(
+        config=CollectionConfig(name="Picks", sync_mode=SyncMode.APPEND),
+        library_name="Movies",
+        items=[
+            CollectionItem(title="Old", jellyfin_id="a", matched=True),
+            CollectionItem(title="New", jellyfin_id="b", matched=True),
+        ],
+    )
+    report = CollectionReport(
+        name="Picks", library="Movies", schedule="daily", source_provider="TMDb List"
+    )
+
+    added, removed, _ = await builder.sync_collection(
+        collection, report, add_missing_to_arr=False
+    )
+
+    assert (added, removed) == (1, 0)
+    assert report.added_titles == ["New"]
+    jellyfin.add_to_collection.assert_awaited_once_with("col", ["b"])
+    jellyfin.remove_from_collection.assert_not_awaited()
+    jellyfin.update_collection_metadata.assert_awaited_once()
+    builder._upload_poster.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_collection_records_arr_sends() -> None:
+    """Arr sends run alongside the poster/metadata step and fill the report."""
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(return_value=[{"Id": "col", "Name": "Picks"}])
+    jellyfin.get_collection_items = AsyncMock(return_value=["a"])
+    jellyfin.update_collection_metadata = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder._upload_poster = AsyncMock(return_value=(True, None))
+    builder._add_missing_to_arr = AsyncMock(return_value=(2, 1))
+    collection = Collection(
+        config=CollectionConfig(name="Picks", sync_mode=SyncMode.APPEND),
+        library_name="Movies",
+        items=[CollectionItem(title="Old", jellyfin_id="a", matched=True)],
+    )
+    report = CollectionReport(
+        name="Picks", library="Movies", schedule="daily", source_provider="TMDb List"
+    )
+
+    await builder.sync_collection(collection, report)
+
+    assert (report.items_sent_to_radarr, report.items_sent_to_sonarr) == (2, 1)
+    builder._add_missing_to_arr.assert_awaited_once_with(collection, report)
+    jellyfin.update_collection_metadata.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_sync_collection_appends_without_reorder_when_order_holds() -> None:
+    """Sorted syncs should only append when new items already sort last."""
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(return_value=[{"Id": "col", "Name": "Picks"}])
+    jellyfin.get_collection_items = AsyncMock(return_value=["a"])
+    jellyfin.add_to_collection = AsyncMock(return_value=True)
+    jellyfin.remove_from_collection = AsyncMock(return_value=True)
+    jellyfin.update_collection_metadata = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder._upload_poster = AsyncMock(return_value=(True, None))
+    collection = Collection(
+        config=CollectionConfig(
+            name="Picks", sync_mode=SyncMode.SYNC, collection_order=CollectionOrder.SORT_NAME
+        ),
+        library_name="Movies",
+        items=[
+            CollectionItem(title="Beta", jellyfin_id="b", matched=True),
+            CollectionItem(title="Alpha", jellyfin_id="a", matched=True),
+        ],
+    )
+    report = CollectionReport(
+        name="Picks", library="Movies", schedule="daily", source_provider="TMDb List"
+    )
+
+    added, removed, _ = await builder.sync_collection(
+        collection, report, add_missing_to_arr=False
+    )
+
+    assert (added, removed) == (1, 0)
+    jellyfin.add_to_collection.assert_awaited_once_with("col", ["b"])
+    jellyfin.remove_from_collection.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sync_collection_reuses_collection_items_within_run() -> None:
+    """A second sync of the same collection should not refetch its items."""
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(return_value=[{"Id": "col", "Name": "Picks"}])
+    jellyfin.get_collection_items = AsyncMock(return_value=["a"])
+    jellyfin.add_to_collection = AsyncMock(return_value=True)
+    jellyfin.remove_from_collection = AsyncMock(return_value=True)
+    jellyfin.update_collection_metadata = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder._upload_poster = AsyncMock(return_value=(True, None))
+    collection = Collection(
+        config=CollectionConfig(name="Picks", sync_mode=SyncMode.APPEND),
+        library_name="Movies",
+        items=[
+            CollectionItem(title="Old", jellyfin_id="a", matched=True),
+            CollectionItem(title="New", jellyfin_id="b", matched=True),
+        ],
+    )
+
+    for _ in range(2):
+        report = CollectionReport(
+            name="Picks", library="Movies", schedule="daily", source_provider="TMDb List"
+        )
+        await builder.sync_collection(collection, report, add_missing_to_arr=False)
+
+    jellyfin.get_collection_items.assert_awaited_once_with("col")
+    jellyfin.add_to_collection.assert_awaited_once_with("col", ["b"])
+
+
+@pytest.mark.asyncio
+async def test_sync_collection_removes_in_collection_order() -> None:
+    """Emptying a synced collection should remove items in their current order."""
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(return_value=[{"Id": "col", "Name": "Picks"}])
+    jellyfin.get_collection_items = AsyncMock(return_value=["z", "a", "y", "x"])
+    jellyfin.add_to_collection = AsyncMock(return_value=True)
+    jellyfin.remove_from_collection = AsyncMock(return_value=True)
+    jellyfin.update_collection_metadata = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder._upload_poster = AsyncMock(return_value=(True, None))
+    collection = Collection(
+        config=CollectionConfig(name="Picks", sync_mode=SyncMode.SYNC),
+        library_name="Movies",
+        items=[CollectionItem(title="Missing", matched=False)],
+    )
+    report = CollectionReport(
+        name="Picks", library="Movies", schedule="daily", source_provider="TMDb List"
+    )
+
+    added, removed, _ = await builder.sync_collection(
+        collection, report, add_missing_to_arr=False
+    )
+
+    assert (added, removed) == (0, 4)
+    jellyfin.remove_from_collection.assert_awaited_once_with("col", ["z", "a", "y", "x"])
+    assert builder._collection_items["col"] == []
+
+
+@pytest.mark.asyncio
+async def test_build_collection_keeps_source_and_filtered_items(
+    builder: CollectionBuilder,
+) -> None:
+    """Source items keep everything fetched; collection items only the filtered ones."""
+    items = [
+        Movie(title="Anime", tmdb_id=1, original_language="ja"),
+        Movie(title="Heat", tmdb_id=2, original_language="en"),
+        Movie(title="Alien", tmdb_id=3, original_language="en"),
+    ]
+    builder._fetch_items = AsyncMock(return_value=items)
+    builder.matcher.prime = AsyncMock()
+    builder.matcher.find_many = AsyncMock(
+        return_value=[
+            LibraryItem(
+                jellyfin_id="jf-2",
+                title="Heat",
+                media_type=MediaType.MOVIE,
+                library_id="lib",
+                library_name="Movies",
+            ),
+            None,
+        ]
+    )
+    config = CollectionConfig(
+        name="English",
+        filters=CollectionFilter(original_language_not=["ja"]),
+    )
+
+    collection, report = await builder.build_collection(
+        config, "Movies", "lib", MediaType.MOVIE
+    )
+
+    assert [i.title for i in collection.source_items] == ["Anime", "Heat", "Alien"]
+    assert [(i.title, i.jellyfin_id, i.matched) for i in collection.items] == [
+        ("Heat", "jf-2", True),
+        ("Alien", None, False),
+    ]
+    assert collection.source_items[1].jellyfin_id is None
+    assert report.matched_titles == ["Heat"]
+    assert report.missing_titles == ["Alien"]
+    assert report.fetched_titles == ["Anime", "Heat", "Alien"]
+    builder.matcher.prime.assert_awaited_once_with("lib", MediaType.MOVIE)
+
+
+@pytest.mark.asyncio
+async def test_fetch_sonarr_taglist_skips_catalog_for_unknown_tags() -> None:
+    """Unknown tag labels should short-circuit before listing the Sonarr catalog."""
+    sonarr = MagicMock()
+    sonarr.get_tags = AsyncMock(return_value=[{"id": 1, "label": "anime"}])
+    sonarr.get_series = AsyncMock(return_value=[])
+    builder = CollectionBuilder(
+        jellyfin=MagicMock(), tmdb=MagicMock(), sonarr=sonarr, dry_run=True
+    )
+
+    items = await builder._fetch_sonarr_taglist({"tags": ["missing"]})
+
+    assert items == []
+    sonarr.get_series.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_sync_collection_uses_largest_duplicate_collection() -> None:
+    """Duplicate collection names should resolve to the one with most children."""
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(
+        return_value=[
+            {"Id": "small", "Name": "Picks", "ChildCount": 2},
+            {"Id": "large", "Name": "Picks", "ChildCount": 9},
+            {"Id": "tie", "Name": "Picks", "ChildCount": 9},
+        ]
+    )
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder._upload_poster = AsyncMock(return_value=(False, None))
+    collection = Collection(config=CollectionConfig(name="Picks"), library_name="Movies")
+    report = CollectionReport(
+        name="Picks", library="Movies", schedule="daily", source_provider="TMDb List"
+    )
+
+    await builder.sync_collection(collection, report, posters_only=True)
+
+    assert collection.jellyfin_id == "large"
+    assert report.collection_existed is True
+
+
+@pytest.mark.asyncio
+async def test_resolve_imdb_ids_tops_up_to_limit_in_order(builder: CollectionBuilder) -> None:
+    """Unresolvable IDs should be replaced by later ones without overfetching."""
+    lookups = {
+        "tt1": Movie(title="One", tmdb_id=1),
+        "tt3": Movie(title="Three", tmdb_id=3),
+        "tt4": Movie(title="Four", tmdb_id=4),
+        "tt5": Movie(title="Five", tmdb_id=5),
+    }
+    builder.tmdb.find_by_imdb_id = AsyncMock(
+        side_effect=lambda imdb_id, media_type: lookups.get(imdb_id)
+    )
+
+    items = await builder._resolve_imdb_ids(
+        ["tt1", "tt1", "tt2", "tt3", "tt4", "tt5"], MediaType.MOVIE, limit=3
+    )
+
+    assert [item.title for item in items] == ["One", "Three", "Four"]
+    requested = [call.args[0] for call in builder.tmdb.find_by_imdb_id.await_args_list]
+    assert requested == ["tt1", "tt2", "tt3", "tt4"]
+
+
+@pytest.mark.asyncio
+async def test_add_missing_to_arr_sends_movies_and_series() -> None:
+    """Missing items should be sent to the matching Arr, backfilling TVDB IDs."""
+    radarr = MagicMock()
+    radarr.default_tag = "jfc"
+    radarr.get_or_create_tag = AsyncMock(return_value=1)
+    radarr.add_movie = AsyncMock(side_effect=[{"id": 1}, RuntimeError("boom")] * 2)
+    radarr.load_blocklist = AsyncMock(return_value=set())
+    radarr.load_exclusions = AsyncMock(return_value=set())
+    sonarr = MagicMock()
+    sonarr.default_tag = "jfc"
+    sonarr.get_or_create_tag = AsyncMock(return_value=1)
+    sonarr.load_blocklist = AsyncMock(return_value=set())
+    sonarr.load_exclusions = AsyncMock(return_value=set())
+    sonarr.add_series = AsyncMock(return_value={"id": 2})
+    tmdb = MagicMock()
+    tmdb.get_series_details = AsyncMock(return_value=Series(title="Show", tvdb_id=555))
+    builder = CollectionBuilder(
+        jellyfin=MagicMock(), tmdb=tmdb, radarr=radarr, sonarr=sonarr, dry_run=True
+    )
+    collection = Collection(
+        config=CollectionConfig(name="Mixed"),
+        library_name="Media",
+        items=[
+            CollectionItem(title="Film A", tmdb_id=1, media_type="movie"),
+            CollectionItem(title="Show", tmdb_id=2, media_type="series"),
+            CollectionItem(title="Film B", tmdb_id=3, media_type="movie"),
+            CollectionItem(title="Owned", tmdb_id=4, media_type="movie", in_library=True),
+        ],
+    )
+    report = CollectionReport(
+        name="Mixed", library="Media", schedule="daily", source_provider="TMDb List"
+    )
+
+    counts = await builder._add_missing_to_arr(collection, report)
+
+    assert counts == (1, 1)
+    assert report.radarr_titles == ["Film A"]
+    assert report.sonarr_titles == ["Show"]
+    sonarr.add_series.assert_awaited_once()
+    assert sonarr.add_series.await_args.kwargs["tvdb_id"] == 555
+    radarr.get_or_create_tag.assert_awaited_once_with("jfc")
+    # Blocklists are loaded once up front, not raced by the concurrent adds
+    radarr.load_blocklist.assert_awaited_once()
+    sonarr.load_exclusions.assert_awaited_once()
+
+    await builder._add_missing_to_arr(collection, report)
+    tmdb.get_series_details.assert_awaited_once_with(2)
+
+
+def test_sort_items_for_collection_orders(builder: CollectionBuilder) -> None:
+    """Sort orders should use their keys, newest first for dates."""
+    items = [
+        CollectionItem(title="b", year=2001, community_rating=7.0),
+        CollectionItem(title="A", year=2020, community_rating=9.0),
+        CollectionItem(title="c", premiere_date=date(2010, 5, 1), community_rating=8.0),
+    ]
+
+    by_name = builder._sort_items_for_collection(items, CollectionOrder.SORT_NAME)
+    by_premiere = builder._sort_items_for_collection(items, CollectionOrder.PREMIERE_DATE)
+    by_rating = builder._sort_items_for_collection(items, CollectionOrder.COMMUNITY_RATING)
+
+    assert [i.title for i in by_name] == ["A", "b", "c"]
+    assert [i.title for i in by_premiere] == ["A", "c", "b"]
+    assert [i.title for i in by_rating] == ["A", "c", "b"]
+    assert builder._sort_items_for_collection(items, CollectionOrder.CUSTOM) is items
+
+
+def test_get_poster_category(builder: CollectionBuilder) -> None:
+    """Poster categories should follow library keywords, then media type."""
+    assert builder._get_poster_category("Dessins Animés Kids", MediaType.MOVIE) == "CARTOONS"
+    assert builder._get_poster_category("ANIME", MediaType.SERIES) == "CARTOONS"
+    assert builder._get_poster_category("Séries", MediaType.SERIES) == "SÉRIES"
+    assert builder._get_poster_category("Films", MediaType.MOVIE) == "FILMS"
+
+
+@pytest.mark.asyncio
+async def test_upload_poster_falls_back_to_cached_ai_poster(tmp_path, monkeypatch) -> None:
+    """A failed forced regeneration should fall back to the cached AI poster."""
+    cached = tmp_path / "poster.png"
+    cached.write_bytes(b"png")
+    settings = MagicMock()
+    settings.openai.enabled = True
+    settings.openai.explicit_refs = False
+    monkeypatch.setattr("jfc.services.collection_builder.get_settings", lambda: settings)
+
+    jellyfin = MagicMock()
+    jellyfin.upload_collection_poster = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder.poster_generator = MagicMock()
+    builder.poster_generator.generate_poster = AsyncMock(side_effect=[None, cached])
+    collection = Collection(
+        config=CollectionConfig(name="Trending"),
+        library_name="Films",
+        jellyfin_id="col",
+        items=[CollectionItem(title="Dune", media_type="movie")],
+    )
+
+    success, path = await builder._upload_poster(
+        collection, MediaType.MOVIE, force_regenerate=True
+    )
+
+    assert (success, path) == (True, cached)
+    calls = builder.poster_generator.generate_poster.await_args_list
+    assert [call.kwargs["force_regenerate"] for call in calls] == [True, False]
+    assert calls[0].kwargs["category"] == "FILMS"
+
+
+@pytest.mark.asyncio
+async def test_upload_poster_missing_file_reports_no_path(tmp_path, monkeypatch) -> None:
+    """A poster file that disappears before upload should not be reported."""
+    settings = MagicMock()
+    settings.openai.enabled = False
+    settings.get_posters_path.return_value = tmp_path
+    monkeypatch.setattr("jfc.services.collection_builder.get_settings", lambda: settings)
+
+    jellyfin = MagicMock()
+    jellyfin.upload_collection_poster = AsyncMock(side_effect=FileNotFoundError)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    (tmp_path / "manual.png").write_bytes(b"png")
+    collection = Collection(
+        config=CollectionConfig(name="Trending", poster="manual.png"),
+        library_name="Films",
+        jellyfin_id="col",
+    )
+
+    assert await builder._upload_poster(collection, MediaType.MOVIE) == (False, None)
+
+
+@pytest.mark.asyncio
+async def test_generate_ai_poster_converts_only_context_items(monkeypatch) -> None:
+    """Only the items the poster generator reads should be converted."""
+    settings = MagicMock()
+    settings.openai.explicit_refs = False
+    monkeypatch.setattr("jfc.services.collection_builder.get_settings", lambda: settings)
+    builder = CollectionBuilder(jellyfin=MagicMock(), tmdb=MagicMock(), dry_run=False)
+    builder.poster_generator = MagicMock()
+    builder.poster_generator.generate_poster = AsyncMock(return_value=None)
+    collection = Collection(
+        config=CollectionConfig(name="Big"),
+        library_name="Films",
+        source_items=[CollectionItem(title=f"Film {n}") for n in range(50)],
+    )
+
+    await builder._generate_ai_poster(collection, MediaType.MOVIE)
+
+    items = builder.poster_generator.generate_poster.await_args.kwargs["items"]
+    assert [item.title for item in items] == [f"Film {n}" for n in range(10)]
+
+
+def test_collection_items_to_media_items_picks_class(builder: CollectionBuilder) -> None:
+    """Series items should convert to Series, everything else to Movie."""
+    items = [
+        CollectionItem(title="Show", media_type="series", genres=["drama"]),
+        CollectionItem(title="Film", media_type="movie"),
+        CollectionItem(title="Unknown"),
+    ]
+
+    media_items = builder._collection_items_to_media_items(items)
+
+    assert [type(item) for item in media_items] == [Series, Movie, Movie]
+    assert media_items[0].genres == ["drama"]
+    assert media_items[1].genres == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_trakt_chart_dispatches_by_chart_and_type() -> None:
+    """Trakt charts should call the matching client method."""
+    trakt = MagicMock()
+    trakt.get_watched_movies = AsyncMock(return_value=[Movie(title="Watched")])
+    trakt.get_popular_series = AsyncMock(return_value=[Series(title="Popular")])
+    builder = CollectionBuilder(
+        jellyfin=MagicMock(), tmdb=MagicMock(), trakt=trakt, dry_run=True
+    )
+
+    watched = await builder._fetch_trakt_chart(
+        {"chart": "watched", "time_period": "monthly", "limit": 5}, MediaType.MOVIE
+    )
+    popular = await builder._fetch_trakt_chart({"chart": "popular"}, MediaType.SERIES)
+    unknown = await builder._fetch_trakt_chart({"chart": "boxoffice"}, MediaType.MOVIE)
+
+    assert [item.title for item in watched] == ["Watched"]
+    assert [item.title for item in popular] == ["Popular"]
+    assert unknown == []
+    trakt.get_watched_movies.assert_awaited_once_with("monthly", 5)
+    trakt.get_popular_series.assert_awaited_once_with(20)
+
+
+@pytest.mark.asyncio
+async def test_sync_collection_random_order_keeps_collection_items(monkeypatch) -> None:
+    """Random order should shuffle the added IDs without reordering collection items."""
+    monkeypatch.setattr(
+        "jfc.services.collection_builder.random.shuffle", lambda ids: ids.reverse()
+    )
+    jellyfin = MagicMock()
+    jellyfin.get_collections = AsyncMock(return_value=[])
+    jellyfin.create_collection = AsyncMock(return_value="col")
+    jellyfin.get_collection_items = AsyncMock(return_value=[])
+    jellyfin.add_to_collection = AsyncMock(return_value=True)
+    jellyfin.update_collection_metadata = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder._upload_poster = AsyncMock(return_value=(False, None))
+    collection = Collection(
+        config=CollectionConfig(name="Shuffle", collection_order=CollectionOrder.RANDOM),
+        library_name="Movies",
+        items=[
+            CollectionItem(title="A", jellyfin_id="a", matched=True),
+            CollectionItem(title="B", jellyfin_id="b", matched=True),
+            CollectionItem(title="C", jellyfin_id="c", matched=True),
+        ],
+    )
+    report = CollectionReport(
+        name="Shuffle", library="Movies", schedule="daily", source_provider="TMDb List"
+    )
+
+    await builder.sync_collection(collection, report, add_missing_to_arr=False)
+
+    jellyfin.add_to_collection.assert_awaited_once_with("col", ["c", "b", "a"])
+    assert [item.title for item in collection.items] == ["A", "B", "C"]
+
+
+@pytest.mark.asyncio
+async def test_upload_poster_uses_manual_poster_without_ai(tmp_path, monkeypatch) -> None:
+    """An existing manual poster should be uploaded without touching the AI path."""
+    (tmp_path / "manual.png").write_bytes(b"png")
+    settings = MagicMock()
+    settings.openai.enabled = True
+    settings.get_posters_path.return_value = tmp_path
+    monkeypatch.setattr("jfc.services.collection_builder.get_settings", lambda: settings)
+
+    jellyfin = MagicMock()
+    jellyfin.upload_collection_poster = AsyncMock(return_value=True)
+    builder = CollectionBuilder(jellyfin=jellyfin, tmdb=MagicMock(), dry_run=False)
+    builder.poster_generator = MagicMock()
+    builder.poster_generator.generate_poster = AsyncMock()
+    builder._collection_items_to_media_items = MagicMock()
+    collection = Collection(
+        config=CollectionConfig(name="Picks", poster="manual.png"),
+        library_name="Films",
+        jellyfin_id="col",
+    )
+
+    success, path = await builder._upload_poster(collection, MediaType.MOVIE)
+
+    assert (success, path) == (True, tmp_path / "manual.png")
+    builder.poster_generator.generate_poster.assert_not_awaited()
+    builder._collection_items_to_media_items.assert_not_called()
+
+
+class TestFetchItems:
+    """Tests for provider fetching."""
+
+    @pytest.mark.asyncio
+    async def test_failed_provider_aborts_build_without_removals(self):
+        """A failing provider must abort the build rather than sync a partial list."""
+        jellyfin = MagicMock()
+        jellyfin.remove_from_collection = AsyncMock(return_value=True)
+        tmdb = MagicMock()
+        tmdb.get_trending_movies = AsyncMock(side_effect=RuntimeError("boom"))
+        tmdb.get_popular_movies = AsyncMock(
+            return_value=[Movie(title="Popular", tmdb_id=1)]
+        )
+        builder = CollectionBuilder(jellyfin=jellyfin, tmdb=tmdb)
+        builder.matcher.prime = AsyncMock()
+        config = CollectionConfig(
+            name="Mixed", tmdb_trending_weekly=10, tmdb_popular=10
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await builder.build_collection(
+                config=config,
+                library_name="Movies",
+                library_id="lib-1",
+                media_type=MediaType.MOVIE,
+            )
+
+        # The other provider still ran to completion before the failure surfaced
+        tmdb.get_popular_movies.assert_awaited_once()
+        jellyfin.remove_from_collection.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_discover_maps_params_and_filter_fallbacks(self):
+        """Discover keys map to client kwargs; filters fill only missing values."""
+        tmdb = MagicMock()
+        tmdb.discover_movies = AsyncMock(return_value=[])
+        builder = CollectionBuilder(jellyfin=MagicMock(), tmdb=tmdb)
+        discover = {"sort_by": "vote_average.desc", "vote_count.gte": 500, "limit": 10}
+        filters = CollectionFilter(vote_average_gte=7.0, tmdb_vote_count_gte=50, year_gte=2000)
+
+        await builder._fetch_tmdb_discover(discover, MediaType.MOVIE, filters)
+
+        tmdb.discover_movies.assert_awaited_once_with(
+            sort_by="vote_average.desc",
+            vote_count_gte=500,
+            vote_average_gte=7.0,
+            primary_release_date_gte=date(2000, 1, 1),
+            limit=10,
+        )
@@ -0,0 +1,64 @@
+"""Unit tests for Jellyfin client."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jfc.clients.jellyfin import JellyfinClient
+
+
+def _response(status_code: int) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+@pytest.mark.asyncio
+async def test_remove_from_collection_sends_every_batch() -> None:
+    """All removal batches should be sent, and any failure reported."""
+    client = JellyfinClient(url="http://jellyfin.test", api_key="key")
+    client.COLLECTION_ITEMS_BATCH_SIZE = 2
+    client.delete = AsyncMock(side_effect=[_response(204), _response(500), _response(204)])
+
+    ok = await client.remove_from_collection("col", ["a", "b", "c", "d", "e"])
+
+    assert ok is False
+    sent = [call.kwargs["params"]["Ids"] for call in client.delete.await_args_list]
+    assert sent == ["a,b", "c,d", "e"]
+
+
+class _JsonResponse:
+    """Minimal response object returning a fixed JSON payload."""
+
+    def __init__(self, payload: dict) -> None:
+        self._payload = payload
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return self._payload
+
+
+@pytest.mark.asyncio
+async def test_get_library_items_fetches_remaining_pages_from_total() -> None:
+    """Pages after the first should follow the server's page size and total."""
+    library = [{"Id": f"id-{n}", "Name": f"Item {n}", "Type": "Movie"} for n in range(5)]
+
+    async def get(endpoint, params=None):
+        start, size = params["StartIndex"], params["Limit"]
+        # Server caps pages at two items regardless of the requested size
+        page = library[start : start + min(size, 2)]
+        return _JsonResponse({"Items": page, "TotalRecordCount": len(library)})
+
+    client = JellyfinClient(url="http://jellyfin.test", api_key="key")
+    client.get = AsyncMock(side_effect=get)
+
+    items = await client.get_library_items("lib")
+
+    assert [item.jellyfin_id for item in items] == [f"id-{n}" for n in range(5)]
+    offsets = [call.kwargs["params"]["StartIndex"] for call in client.get.await_args_list]
+    assert offsets == [0, 2, 4]
+    params = client.get.await_args.kwargs["params"]
+    assert params["Fields"] == "ProviderIds,Path,Genres"
+    assert params["EnableImages"] is False
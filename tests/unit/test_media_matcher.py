@@ -1,5 +1,6 @@
 """Unit tests for MediaMatcher service."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -64,8 +65,9 @@ class TestMediaMatcher:
         """Test matcher initialization."""
         matcher = MediaMatcher(mock_jellyfin)
         assert matcher.jellyfin == mock_jellyfin
-        assert matcher._cache == {}
-        assert matcher._library_loaded == {}
+        assert matcher._hits == {}
+        assert matcher._misses == set()
+        assert matcher._library_loaded == set()
 
     @pytest.mark.asyncio
     async def test_find_in_library_by_tmdb_id(
@@ -188,9 +190,22 @@ class TestMediaMatcher:
 
     def test_clear_cache(self, matcher):
         """Test cache clearing."""
-        matcher._cache[123] = "test"
+        matcher._hits[123] = "test"
+        matcher._misses.add(456)
         matcher.clear_cache()
-        assert matcher._cache == {}
+        assert matcher._hits == {}
+        assert matcher._misses == set()
+
+    async def test_reset_clears_per_run_state(self, matcher, sample_library_items, mock_jellyfin):
+        """Test that reset drops loaded libraries and their load locks."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+        await matcher.prime("lib-001", MediaType.MOVIE)
+        assert matcher._load_locks
+
+        matcher.reset()
+
+        assert matcher._library_loaded == set()
+        assert matcher._load_locks == {}
 
 
 class TestIsMatch:
@@ -335,6 +350,8 @@ class TestNormalizeTitle:
         assert matcher._normalize_title("The Movie") == "movie"
         assert matcher._normalize_title("A Movie") == "movie"
         assert matcher._normalize_title("An Apple") == "apple"
+        # Only one leading article is removed
+        assert matcher._normalize_title("The A Team") == "a team"
 
     def test_remove_articles_french(self, matcher):
         """Test removing French articles."""
@@ -347,6 +364,7 @@ class TestNormalizeTitle:
     def test_remove_special_characters(self, matcher):
         """Test removing special characters."""
         assert matcher._normalize_title("Movie: Part 2") == "movie part 2"
+        assert matcher._normalize_title("Amélie_(2001)!") == "amélie2001"
         # Note: "The" in the middle is NOT removed, only at the start
         assert matcher._normalize_title("Movie - The Sequel") == "movie the sequel"
 
@@ -359,3 +377,210 @@ class TestNormalizeTitle:
         """Test keeping alphanumeric characters."""
         assert matcher._normalize_title("Movie 2") == "movie 2"
         assert matcher._normalize_title("Movie123") == "movie123"
+
+    def test_normalization_is_cached(self, matcher):
+        """Repeated titles should be served from the normalization cache."""
+        matcher._normalize_title.cache_clear()
+
+        matcher._normalize_title("The Cached Title")
+        matcher._normalize_title("The Cached Title")
+
+        assert matcher._normalize_title.cache_info().hits == 1
+
+
+class TestExternalIdIndex:
+    """Tests for IMDb/TVDB library indexes."""
+
+    @pytest.mark.asyncio
+    async def test_find_by_imdb_id_without_search(self, matcher, mock_jellyfin):
+        """Items without TMDb ID should match the cached IMDb index."""
+        mock_jellyfin.get_library_items.return_value = [
+            LibraryItem(
+                jellyfin_id="jf-200",
+                title="Classic",
+                year=1960,
+                media_type=MediaType.MOVIE,
+                imdb_id="tt0054215",
+                library_id="lib-001",
+                library_name="Films",
+            )
+        ]
+
+        item = MediaItem(title="Classic", media_type=MediaType.MOVIE, imdb_id="tt0054215")
+
+        result = await matcher.find_in_library(item, library_id="lib-001")
+
+        assert result is not None
+        assert result.jellyfin_id == "jf-200"
+        mock_jellyfin.search_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_by_tvdb_id_without_search(self, matcher, mock_jellyfin):
+        """Series without TMDb ID should match the cached TVDB index."""
+        mock_jellyfin.get_library_items.return_value = [
+            LibraryItem(
+                jellyfin_id="jf-300",
+                title="Show",
+                media_type=MediaType.SERIES,
+                tvdb_id=81189,
+                library_id="lib-002",
+                library_name="Séries",
+            )
+        ]
+
+        item = MediaItem(title="Show", media_type=MediaType.SERIES, tvdb_id=81189)
+
+        result = await matcher.find_in_library(item, library_id="lib-002")
+
+        assert result is not None
+        assert result.jellyfin_id == "jf-300"
+        mock_jellyfin.search_items.assert_not_called()
+
+
+class TestFindMany:
+    """Tests for find_many batch matching."""
+
+    @pytest.mark.asyncio
+    async def test_find_many_preserves_order(
+        self, matcher, mock_jellyfin, sample_library_items
+    ):
+        """Results should line up with the input items."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+
+        items = [
+            MediaItem(title="The Batman", media_type=MediaType.MOVIE, tmdb_id=414906),
+            MediaItem(title="Unknown", media_type=MediaType.MOVIE, tmdb_id=999999),
+            MediaItem(title="Dune: Part Two", media_type=MediaType.MOVIE, tmdb_id=693134),
+        ]
+
+        results = await matcher.find_many(items, library_id="lib-001")
+
+        assert [r.jellyfin_id if r else None for r in results] == ["jf-003", None, "jf-001"]
+        assert mock_jellyfin.get_library_items.call_count == 1
+        mock_jellyfin.search_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_fetch_library_once(
+        self, matcher, mock_jellyfin, sample_library_items
+    ):
+        """Concurrent callers for a cold library should share one fetch."""
+
+        async def slow_listing(**kwargs):
+            await asyncio.sleep(0)
+            return sample_library_items
+
+        mock_jellyfin.get_library_items.side_effect = slow_listing
+
+        await asyncio.gather(
+            matcher.prime("lib-001", MediaType.MOVIE),
+            matcher.get_library_items("lib-001", MediaType.MOVIE),
+        )
+
+        assert mock_jellyfin.get_library_items.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_library_items_reuses_match_listing(
+        self, matcher, mock_jellyfin, sample_library_items
+    ):
+        """Listing a library after matching should not refetch it."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+
+        await matcher.prime("lib-001", MediaType.MOVIE)
+        listing = await matcher.get_library_items("lib-001", MediaType.MOVIE)
+
+        assert listing == sample_library_items
+        assert mock_jellyfin.get_library_items.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_find_many_searches_items_without_tmdb_id(self, matcher, mock_jellyfin):
+        """Items without TMDb ID should fall back to title search."""
+        mock_jellyfin.search_items.return_value = [
+            LibraryItem(
+                jellyfin_id="jf-100",
+                title="Old Movie",
+                year=2020,
+                media_type=MediaType.MOVIE,
+                library_id="lib-001",
+                library_name="Films",
+            )
+        ]
+
+        items = [MediaItem(title="Old Movie", year=2020, media_type=MediaType.MOVIE)]
+
+        results = await matcher.find_many(items, library_id="lib-001")
+
+        assert results[0] is not None
+        assert results[0].jellyfin_id == "jf-100"
+
+    @pytest.mark.asyncio
+    async def test_prime_loads_library_once(self, matcher, mock_jellyfin, sample_library_items):
+        """Priming should load the library so later lookups reuse it."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+
+        await matcher.prime("lib-001", MediaType.MOVIE)
+        items = [MediaItem(title="The Batman", media_type=MediaType.MOVIE, tmdb_id=414906)]
+        results = await matcher.find_many(items, library_id="lib-001")
+
+        assert results[0].jellyfin_id == "jf-003"
+        assert mock_jellyfin.get_library_items.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_find_many_failed_search_leaves_item_unmatched(self, matcher, mock_jellyfin):
+        """A failing title search should not abort the other lookups."""
+        hit = LibraryItem(
+            jellyfin_id="jf-200",
+            title="Found Movie",
+            year=2019,
+            media_type=MediaType.MOVIE,
+            library_id="lib-001",
+            library_name="Films",
+        )
+
+        async def search_items(query, media_type, limit):
+            if query == "Broken":
+                raise RuntimeError("search failed")
+            return [hit]
+
+        mock_jellyfin.search_items.side_effect = search_items
+        items = [
+            MediaItem(title="Broken", media_type=MediaType.MOVIE),
+            MediaItem(title="Found Movie", year=2019, media_type=MediaType.MOVIE),
+        ]
+
+        results = await matcher.find_many(items, library_id="lib-001")
+
+        assert results[0] is None
+        assert results[1].jellyfin_id == "jf-200"
+
+    @pytest.mark.asyncio
+    async def test_find_many_uses_title_index_before_search(
+        self, matcher, mock_jellyfin, sample_library_items
+    ):
+        """Items without IDs should match the loaded library by title and year."""
+        mock_jellyfin.get_library_items.return_value = sample_library_items
+
+        items = [
+            MediaItem(title="Batman", year=2022, media_type=MediaType.MOVIE),
+            MediaItem(title="Oppenheimer", year=2010, media_type=MediaType.MOVIE),
+        ]
+
+        results = await matcher.find_many(items, library_id="lib-001")
+
+        assert results[0].jellyfin_id == "jf-003"
+        assert results[1] is None
+        mock_jellyfin.search_items.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_warm_loads_libraries_and_tolerates_failures(self, matcher, mock_jellyfin):
+        """Warming should load every library and log, not raise, on failures."""
+
+        async def listing(library_id, media_type, limit):
+            if library_id == "broken":
+                raise RuntimeError("timeout")
+            return []
+
+        mock_jellyfin.get_library_items.side_effect = listing
+
+        await matcher.warm({"lib-001": MediaType.MOVIE, "broken": MediaType.SERIES})
+
+        assert matcher._library_loaded == {"lib-001"}
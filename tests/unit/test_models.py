@@ -309,6 +309,29 @@ class TestCollectionItem:
         assert item.matched is True
         assert item.in_library is True
 
+    def test_from_media_item(self):
+        """Test building a collection item from a provider item."""
+        movie = Movie(title="Dune", year=2021, tmdb_id=438631, genres=[878], overview="Spice")
+
+        item = CollectionItem.from_media_item(movie, jellyfin_id="jf-1", matched=True)
+
+        assert item.title == "Dune"
+        assert item.media_type == "movie"
+        assert item.jellyfin_id == "jf-1"
+        assert item.matched is True
+        assert item.in_library is True
+        assert item.genres == [878]
+        assert item.premiere_date is None
+
+    def test_from_media_item_defaults_unmatched(self):
+        """Test unmatched items have no Jellyfin ID and empty genres become None."""
+        item = CollectionItem.from_media_item(Series(title="Severance"))
+
+        assert item.media_type == "series"
+        assert item.jellyfin_id is None
+        assert item.matched is False
+        assert item.genres is None
+
 
 class TestCollection:
     """Tests for Collection model."""
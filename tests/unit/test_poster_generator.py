@@ -1,7 +1,8 @@
 """Unit tests for PosterGenerator service (prompt generation only, no API calls)."""
 
+import asyncio
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -142,6 +143,24 @@ class TestSafeFilename:
         assert "é" in result or "e" in result  # Either preserved or transliterated
 
 
+class TestCleanDisplayName:
+    """Tests for _clean_display_name method."""
+
+    def test_strips_category_suffix(self, tmp_path: Path):
+        """Test that category suffixes are removed but emojis are kept."""
+        from jfc.services.poster_generator import PosterGenerator
+
+        with patch.object(PosterGenerator, "_load_templates"):
+            generator = PosterGenerator(
+                api_key="test-key",
+                output_dir=tmp_path,
+            )
+
+        assert generator._clean_display_name("🔥 Tendances (Films)") == "🔥 Tendances"
+        assert generator._clean_display_name("Anime (séries) ") == "Anime"
+        assert generator._clean_display_name("(TV)") == "(TV)"
+
+
 class TestCollectionThemes:
     """Tests for collection_themes configuration."""
 
@@ -243,6 +262,31 @@ class TestHistoryCleanup:
         remaining = list(prompts_dir.glob("*.json"))
         assert len(remaining) == 3
 
+    def test_cleanup_keeps_newest_files(self, tmp_path: Path):
+        """Test that cleanup keeps the most recent timestamps and ignores other files."""
+        from jfc.services.poster_generator import PosterGenerator
+
+        with patch.object(PosterGenerator, "_load_templates"):
+            generator = PosterGenerator(
+                api_key="test-key",
+                output_dir=tmp_path,
+                poster_history_limit=2,
+            )
+
+        col_dir = generator._get_collection_dir("Films", "Test")
+        history_dir = col_dir / "history"
+        for name in ("2024-01-03_120000.png", "2024-01-01_120000.png", "2024-01-02_120000.png"):
+            (history_dir / name).touch()
+        (history_dir / "notes.txt").touch()
+
+        generator._cleanup_history(col_dir)
+
+        assert sorted(f.name for f in history_dir.iterdir()) == [
+            "2024-01-02_120000.png",
+            "2024-01-03_120000.png",
+            "notes.txt",
+        ]
+
     def test_cleanup_unlimited_when_zero(self, tmp_path: Path):
         """Test no cleanup when limit is 0 (unlimited)."""
         from jfc.services.poster_generator import PosterGenerator
@@ -285,57 +329,237 @@ class TestTemplateLoading:
         """Test loading template from package defaults."""
         from jfc.services.poster_generator import PosterGenerator
 
-        with patch.object(PosterGenerator, "_load_templates"):
+        pkg_templates = tmp_path / "pkg_templates"
+        pkg_templates.mkdir()
+        (pkg_templates / "test.j2").write_text("Test template")
+
+        with patch.object(PosterGenerator, "PACKAGE_TEMPLATES_DIR", pkg_templates):
             generator = PosterGenerator(
                 api_key="test-key",
                 output_dir=tmp_path,
             )
 
-        # This should load from package templates
-        # Mocking for unit test - actual file reading tested in integration
-        generator.package_templates_dir = tmp_path / "pkg_templates"
-        generator.package_templates_dir.mkdir()
-        (generator.package_templates_dir / "test.j2").write_text("Test template")
-
-        content = generator._get_template("test.j2")
-        assert content == "Test template"
+        template = generator._get_template("test.j2")
+        assert template.render() == "Test template"
 
     def test_get_template_user_override(self, tmp_path: Path):
         """Test that user templates override package templates."""
         from jfc.services.poster_generator import PosterGenerator
 
-        with patch.object(PosterGenerator, "_load_templates"):
+        # Setup package template
+        pkg_templates = tmp_path / "pkg_templates"
+        pkg_templates.mkdir()
+        (pkg_templates / "test.j2").write_text("Package template")
+
+        # Setup user override
+        user_templates = tmp_path / "user_templates"
+        user_templates.mkdir()
+        (user_templates / "test.j2").write_text("User template")
+
+        with patch.object(PosterGenerator, "PACKAGE_TEMPLATES_DIR", pkg_templates):
             generator = PosterGenerator(
                 api_key="test-key",
                 output_dir=tmp_path,
+                templates_dir=user_templates,
             )
 
-        # Setup package template
-        generator.package_templates_dir = tmp_path / "pkg_templates"
-        generator.package_templates_dir.mkdir()
-        (generator.package_templates_dir / "test.j2").write_text("Package template")
-
-        # Setup user override
-        generator.templates_dir = tmp_path / "user_templates"
-        generator.templates_dir.mkdir()
-        (generator.templates_dir / "test.j2").write_text("User template")
-
-        content = generator._get_template("test.j2")
-        assert content == "User template"
+        template = generator._get_template("test.j2")
+        assert template.render() == "User template"
 
     def test_get_template_not_found_raises(self, tmp_path: Path):
         """Test that missing template raises FileNotFoundError."""
         from jfc.services.poster_generator import PosterGenerator
 
-        with patch.object(PosterGenerator, "_load_templates"):
+        empty = tmp_path / "empty"
+        empty.mkdir()
+
+        with patch.object(PosterGenerator, "PACKAGE_TEMPLATES_DIR", empty):
             generator = PosterGenerator(
                 api_key="test-key",
                 output_dir=tmp_path,
             )
 
-        generator.templates_dir = None
-        generator.package_templates_dir = tmp_path / "empty"
-        generator.package_templates_dir.mkdir()
-
         with pytest.raises(FileNotFoundError):
             generator._get_template("nonexistent.j2")
+
+    def test_compiled_template_is_cached(self, tmp_path: Path):
+        """Test that a template is compiled once and written to the bytecode cache."""
+        from jfc.services.poster_generator import PosterGenerator
+
+        user_templates = tmp_path / "user_templates"
+        user_templates.mkdir()
+        (user_templates / "test.j2").write_text("Hello {{ name }}")
+
+        generator = PosterGenerator(
+            api_key="test-key",
+            output_dir=tmp_path,
+            templates_dir=user_templates,
+        )
+
+        first = generator._get_template("test.j2")
+        second = generator._get_template("test.j2")
+
+        assert first is second
+        assert first.render(name="World") == "Hello World"
+        assert any((tmp_path / "jinja_bcc").iterdir())
+
+
+class TestSignatureGeneration:
+    """Tests for visual signature generation from metadata."""
+
+    async def test_generates_concurrently_and_caches_in_order(self, tmp_path: Path):
+        """Test that signatures are generated in input order, skipping failures."""
+        from jfc.models.media import MediaItem, MediaType
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+
+        def _response(content):
+            return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+        generator.client = MagicMock()
+        generator.client.chat.completions.create = AsyncMock(
+            side_effect=[_response(" Neon rain "), RuntimeError("boom"), _response("Desert dunes")]
+        )
+
+        items = [
+            MediaItem(title=title, media_type=MediaType.MOVIE, genres=[878])
+            for title in ("Blade Runner", "Broken", "Dune")
+        ]
+
+        signatures = await generator._generate_signatures_from_metadata(items)
+
+        assert signatures == ["Neon rain", "Desert dunes"]
+        assert generator.signatures_cache == {"Blade Runner": "Neon rain", "Dune": "Desert dunes"}
+        assert generator.signatures_log_path.exists()
+
+    def test_signatures_survive_reload_and_compaction(self, tmp_path: Path):
+        """Test that appended signatures are replayed and compacted atomically."""
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        generator.signatures_cache["Alien"] = "Dark corridors"
+        generator._append_signatures({"Alien": "Dark corridors"})
+        with open(generator.signatures_log_path, "a", encoding="utf-8") as f:
+            f.write('{"Truncated": ')  # Interrupted write
+
+        reloaded = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        assert reloaded.signatures_cache == {"Alien": "Dark corridors"}
+
+        reloaded._save_signatures_cache()
+        assert not reloaded.signatures_log_path.exists()
+        assert PosterGenerator(
+            api_key="test-key", output_dir=tmp_path
+        ).signatures_cache == {"Alien": "Dark corridors"}
+
+    async def test_openai_calls_are_bounded(self, tmp_path: Path):
+        """Test that concurrent OpenAI calls never exceed the semaphore limit."""
+        from jfc.models.media import MediaItem, MediaType
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        in_flight = 0
+        peak = 0
+
+        async def _create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return MagicMock(choices=[MagicMock(message=MagicMock(content="Signature"))])
+
+        generator.client = MagicMock()
+        generator.client.chat.completions.create = _create
+
+        items = [
+            MediaItem(title=f"Movie {i}", media_type=MediaType.MOVIE) for i in range(10)
+        ]
+        await generator._generate_signatures_from_metadata(items)
+
+        assert peak == PosterGenerator.MAX_CONCURRENT_REQUESTS
+
+
+class TestGeneratePoster:
+    """Tests for the poster generation pipeline with mocked API calls."""
+
+    async def test_regenerate_moves_old_poster_and_saves_prompt(self, tmp_path: Path):
+        """Test that regeneration archives the old poster and writes the new files."""
+        import base64
+
+        from jfc.models.collection import CollectionConfig
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        generator.client = MagicMock()
+        generator.client.chat.completions.create = AsyncMock(
+            return_value=MagicMock(choices=[MagicMock(message=MagicMock(content="A scene"))])
+        )
+        generator.client.images.generate = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(b64_json=base64.b64encode(b"new").decode())])
+        )
+
+        col_dir = generator._get_collection_dir("Films", "Trending")
+        (col_dir / "poster.png").write_bytes(b"old")
+
+        path = await generator.generate_poster(
+            CollectionConfig(name="Trending"),
+            items=[],
+            category="FILMS",
+            library="Films",
+            force_regenerate=True,
+        )
+
+        assert path == col_dir / "poster.png"
+        assert path.read_bytes() == b"new"
+        assert [f.read_bytes() for f in (col_dir / "history").glob("*.png")] == [b"old"]
+        assert len(list((col_dir / "prompts").glob("*.json"))) == 1
+
+    async def test_concurrent_posters_share_inflight_signature(self, tmp_path: Path):
+        """Test that overlapping posters trigger a single GPT call per title."""
+        from jfc.models.media import MediaItem, MediaType
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+
+        async def _create(**kwargs):
+            await asyncio.sleep(0)
+            return MagicMock(choices=[MagicMock(message=MagicMock(content="Neon rain"))])
+
+        generator.client = MagicMock()
+        generator.client.chat.completions.create = AsyncMock(side_effect=_create)
+
+        item = MediaItem(title="Blade Runner", media_type=MediaType.MOVIE)
+        first, second = await asyncio.gather(
+            generator._extract_visual_signatures([item]),
+            generator._extract_visual_signatures([item]),
+        )
+
+        assert generator.client.chat.completions.create.await_count == 1
+        assert "Neon rain" in first
+        assert "Neon rain" in second
+        assert generator._inflight == {}
+
+
+class TestRenderContext:
+    """Tests for the shared prompt render context."""
+
+    def test_context_resolved_once_per_poster(self, tmp_path: Path):
+        """Test that both prompts are built from a single theme/name resolution."""
+        from jfc.models.collection import CollectionConfig
+        from jfc.services.poster_generator import PosterGenerator
+
+        generator = PosterGenerator(api_key="test-key", output_dir=tmp_path)
+        config = CollectionConfig(name="🔥 Tendances (Films)")
+
+        with patch.object(
+            generator, "_get_collection_theme", wraps=generator._get_collection_theme
+        ) as theme_lookup:
+            context = generator._prepare_render_context(config, "FILMS")
+            scene_prompt = generator._build_scene_prompt(context, "FILMS", "Neon rain")
+            image_prompt = generator._build_prompt(context, "FILMS", "A scene")
+
+        assert theme_lookup.call_count == 1
+        assert context["display_name"] == "🔥 Tendances"
+        assert "🔥 Tendances" in scene_prompt
+        assert "🔥 Tendances" in image_prompt
@@ -0,0 +1,28 @@
+"""Unit tests for Radarr client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jfc.clients.radarr import RadarrClient
+
+
+@pytest.mark.asyncio
+async def test_concurrent_blocklist_check_sees_complete_set() -> None:
+    """A caller racing the blocklist load must not see a partially filled set."""
+    client = RadarrClient(url="http://radarr.test", api_key="key")
+    client.get_blocklist = AsyncMock(return_value=[{"movieId": 1}, {"movieId": 2}])
+
+    async def _get(endpoint: str, **kwargs) -> MagicMock:
+        await asyncio.sleep(0)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"tmdbId": int(endpoint.rsplit("/", 1)[1]) * 100}
+        return response
+
+    client.get = _get
+
+    loaded, blocked = await asyncio.gather(client.load_blocklist(), client.is_blocklisted(200))
+
+    assert loaded == {100, 200}
+    assert blocked is True